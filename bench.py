@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from profiler import COLUMNS, TIMES
+
+SEED = 1234
+
+# Named scenario: enemy count, mode and koyta tick chalabe
+SCENARIOS = {
+    "enemies-5": dict(enemies=5),
+    "enemies-500": dict(enemies=500),
+    "enemies-5000": dict(enemies=5000, ticks=1000),
+    "autoshoot-aim": dict(enemies=50, auto_shoot=True, auto_aim=True, fp=True),
+    "bullet-storm": dict(enemies=500, auto_shoot=True, fire_every=1),
+    "render-fp": dict(enemies=500, fp=True, render=True, ticks=200),
+    "render-tp": dict(enemies=500, render=True, ticks=200),
+}
+
+
+def run_scenario(name, spec, ticks=None):
+    # Notun process e ekta scenario chalay, jate memory and GL state alada thake
+    if spec.get("render"):
+        import offscreen
+        offscreen.create_context(1000, 800)
+        from OpenGL.GL import glFinish
+    from headless import HeadlessEngine
+
+    engine = HeadlessEngine(seed=SEED, enemies=spec.get("enemies"),
+                            auto_shoot=spec.get("auto_shoot", False),
+                            auto_aim=spec.get("auto_aim", False),
+                            fp=spec.get("fp", False))
+    cfg, prof = engine.cfg, engine.logic.prof
+    # Player mare na, jate prottek run e same shongkhok tick chole
+    cfg.hp = cfg.max_miss = 10 ** 9
+    prof.enable()
+
+    ticks = ticks or spec.get("ticks", 5000)
+    fire_every = spec.get("fire_every")
+    start = time.perf_counter()
+    for i in range(ticks):
+        if fire_every and i % fire_every == 0:
+            # Ghurte ghurte fire kore arena bullet e bhore dey
+            cfg.p_rot = (cfg.p_rot + 7) % 360
+            engine.logic.fire_weapon()
+        if spec.get("render"):
+            prof.begin()
+            engine.game.draw_world()
+            glFinish()
+        engine.step(1)
+    elapsed = time.perf_counter() - start
+
+    rows = prof.rows()
+    phases = {col: float(rows[:, i].mean() * 1e3)
+              for i, col in enumerate(COLUMNS)
+              if col in TIMES and col != "frame" and rows[:, i].any()}
+    return {
+        "name": name,
+        "ticks": ticks,
+        "seconds": elapsed,
+        "ticks_per_sec": ticks / elapsed,
+        "phases_ms": phases,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "enemies": len(cfg.enemies),
+        "bullets": len(cfg.bullets),
+        "score": cfg.score,
+    }
+
+
+def run_threading(frames, enemies, fps, auto_shoot):
+    # Offscreen e same scene serial (tick + draw) and threaded (sim alada thread) e mape
+    import offscreen
+    offscreen.create_context(1000, 800)
+    import random
+
+    import numpy as np
+    from OpenGL.GL import glFinish
+
+    from intense import GameController
+    from simthread import ThreadedGame
+
+    def setup(game):
+        random.seed(SEED)
+        game.cfg.max_e = enemies
+        game.cfg.auto_shoot = auto_shoot
+        game.cfg.e_hitbox = 40 if auto_shoot else 60
+        game.cfg.hp = game.cfg.max_miss = 10 ** 9
+
+    results = {}
+    # Serial: proti frame e sim_hz/fps tick chalay tarpor draw kore (window mode er moto)
+    game = GameController()
+    setup(game)
+    game.start_game()
+    per_frame = max(1, game.cfg.sim_hz // fps)
+    total = frames * per_frame
+    times = []
+    begin = time.perf_counter()
+    for _ in range(frames):
+        start = time.perf_counter()
+        for _ in range(per_frame):
+            game.logic.tick()
+        game.draw_world()
+        glFinish()
+        times.append(time.perf_counter() - start)
+    results["serial"] = (times, total, time.perf_counter() - begin)
+
+    # Threaded: sim nijer thread e same total tick real time er opekkha na kore chalay,
+    # render same shongkhok frame draw kore; duitai same kaj, tai elapsed shoja mela jay
+    threaded = ThreadedGame(limit=total)
+    setup(threaded.sim_game)
+    threaded.start_game()
+    times = []
+    begin = time.perf_counter()
+    for _ in range(frames):
+        start = time.perf_counter()
+        threaded.sync()
+        threaded.screen.draw_world()
+        glFinish()
+        times.append(time.perf_counter() - start)
+    # Draw age shesh hole sim er baki tick er jonno opekkha kore
+    while threaded.sim.running:
+        time.sleep(0.001)
+    threaded.sim.stop()
+    results["threaded"] = (times, threaded.sim_game.tick_count, time.perf_counter() - begin)
+
+    out = {}
+    for mode, (times, ticks, elapsed) in results.items():
+        p50, p99 = np.percentile(times, [50, 99]) * 1e3
+        out[mode] = {"frames": len(times), "frame_p50_ms": p50, "frame_p99_ms": p99,
+                     "fps": len(times) / elapsed, "ticks": ticks, "elapsed_s": elapsed}
+    return out
+
+
+def cores():
+    # Ei process koyta core e chalte pare (taskset/cgroup shoho), and machine e mot koyta
+    usable = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    return usable, os.cpu_count()
+
+
+def compare(results, baseline, threshold):
+    # Baseline theke threshold er beshi slow hole regression
+    failed = []
+    for res in results:
+        base = baseline.get(res["name"])
+        if base is None:
+            print(f"  {res['name']}: no baseline")
+            continue
+        ratio = res["ticks_per_sec"] / base["ticks_per_sec"]
+        status = "ok"
+        if ratio < 1 - threshold:
+            status = "REGRESSION"
+            failed.append(res["name"])
+        print(f"  {res['name']}: {ratio:.2f}x baseline  {status}")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless game benchmarks")
+    parser.add_argument("scenarios", nargs="*",
+                        help=f"scenario names (default: all), from {', '.join(SCENARIOS)}")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help="override tick count of every scenario")
+    parser.add_argument("--render", action="store_true",
+                        help="include offscreen Mesa render scenarios")
+    parser.add_argument("--baseline", default="bench_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--json", metavar="PATH", help="write results to PATH")
+    parser.add_argument("--threading", action="store_true",
+                        help="compare serial vs simulation-thread frame times offscreen")
+    parser.add_argument("--frames", type=int, default=200,
+                        help="frames drawn per mode with --threading")
+    parser.add_argument("--enemies", type=int, default=500,
+                        help="enemy count with --threading")
+    args = parser.parse_args(argv)
+
+    if args.threading:
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+            out = pool.submit(run_threading, args.frames, args.enemies, 60, True).result()
+        usable, total = cores()
+        print(f"{usable} of {total} core(s) usable")
+        for mode, res in out.items():
+            print(f"{mode:9} {res['ticks']} ticks in {res['elapsed_s']:6.2f} s  "
+                  f"{res['frames']:5} frames  p50 {res['frame_p50_ms']:7.2f} ms  "
+                  f"p99 {res['frame_p99_ms']:7.2f} ms  {res['fps']:6.1f} fps")
+        if usable < 2:
+            print("logic and render share one core, threaded mode cannot overlap them")
+        return 0
+
+    names = args.scenarios or [n for n, s in SCENARIOS.items()
+                               if args.render or not s.get("render")]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+
+    results = []
+    for name in names:
+        # Prottek scenario er jonno fresh process, jate peak memory alada mapa jay
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+            res = pool.submit(run_scenario, name, SCENARIOS[name], args.ticks).result()
+        results.append(res)
+        phases = "  ".join(f"{k}={v:.3f}" for k, v in res["phases_ms"].items())
+        print(f"{name:14} {res['ticks_per_sec']:10.0f} ticks/s  "
+              f"peak {res['peak_rss_mb']:.0f} MB  ({phases} ms)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update({r["name"]: r for r in results})
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=1)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --save-baseline first")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    print(f"compared with {args.baseline} (threshold {args.threshold:.0%}):")
+    return 1 if compare(results, baseline, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import argparse
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+
+import numpy as np
+
+import offscreen
+from offscreen import Framebuffer, PixelReader, glFinish, glReadPixels, GL_RGBA, GL_UNSIGNED_BYTE
+from headless import HeadlessEngine
+
+
+def png_bytes(rgba, width, height, level=1):
+    # GL er bottom-up RGBA pixel theke RGB PNG banay (shudhu zlib lage)
+    rows = np.frombuffer(rgba, np.uint8).reshape(height, width, 4)[::-1, :, :3]
+    raw = np.zeros((height, width * 3 + 1), np.uint8)  # Prottek row er age filter byte 0
+    raw[:, 1:] = rows.reshape(height, -1)
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    return (b"\x89PNG\r\n\x1a\n" +
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) +
+            chunk(b"IDAT", zlib.compress(raw.tobytes(), level)) +
+            chunk(b"IEND", b""))
+
+
+class FrameWriter:
+    # Alada thread e frame disk e likhe, render loop shudhu queue te rakhe
+    def __init__(self, out, fmt, width, height, backlog=8, block=False):
+        self.out, self.fmt = out, fmt
+        self.width, self.height = width, height
+        self.block = block          # Queue bhora thakle opekkha korbe na frame bad dibe
+        self.queue = queue.Queue(backlog)
+        self.written = 0
+        self.dropped = 0
+        self.bytes = 0
+        os.makedirs(out, exist_ok=True)
+        # Raw hole shob frame ekta file e pore pore (bottom-up RGBA)
+        self.stream = open(os.path.join(out, "frames.rgba"), "wb") if fmt == "raw" else None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def put(self, index, data):
+        try:
+            self.queue.put((index, data), block=self.block)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            index, data = item
+            if self.stream is not None:
+                self.stream.write(data)
+            else:
+                data = png_bytes(data, self.width, self.height)
+                with open(os.path.join(self.out, f"frame_{index:05d}.png"), "wb") as f:
+                    f.write(data)
+            self.written += 1
+            self.bytes += len(data)
+
+    def close(self):
+        # Queue te thaka shob frame likhe thread bondho kore
+        self.queue.put(None)
+        self.thread.join()
+        if self.stream is not None:
+            self.stream.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the game offscreen and capture frames")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--size", default="1000x800", help="WIDTHxHEIGHT")
+    parser.add_argument("--fps", type=int, default=60,
+                        help="game time per frame (sim_hz / fps ticks)")
+    parser.add_argument("--out", default="capture")
+    parser.add_argument("--format", choices=("png", "raw"), default="png")
+    parser.add_argument("--pbo", type=int, default=3,
+                        help="pixel buffer objects in flight (0 = synchronous glReadPixels)")
+    parser.add_argument("--block", action="store_true",
+                        help="wait for the writer instead of dropping frames")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--enemies", type=int, default=None)
+    parser.add_argument("--auto-shoot", action="store_true")
+    parser.add_argument("--fp", action="store_true")
+    args = parser.parse_args(argv)
+
+    width, height = (int(v) for v in args.size.split("x"))
+    offscreen.create_context(width, height)
+    fb = Framebuffer(width, height)
+    fb.bind()
+    reader = PixelReader(width, height, args.pbo) if args.pbo else None
+    writer = FrameWriter(args.out, args.format, width, height, block=args.block)
+
+    engine = HeadlessEngine(seed=args.seed, enemies=args.enemies,
+                            auto_shoot=args.auto_shoot, auto_aim=args.fp, fp=args.fp)
+    game, cfg = engine.game, engine.cfg
+    cfg.scr_w, cfg.scr_h = width, height
+    ticks = max(1, cfg.sim_hz // args.fps)
+
+    # HUD er glyph atlas GLUT font lage, EGL e GLUT nei tai shudhu 3D scene capture hoy
+    start = time.perf_counter()
+    for i in range(args.frames):
+        engine.step(ticks)
+        game.draw_world()
+        if reader is None:
+            data = glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE)
+            writer.put(i, bytes(data))
+            continue
+        # Purono readback shesh hole writer e dey, tarpor ei frame er readback shuru
+        if reader.full():
+            writer.put(*reversed(reader.finish()))
+        reader.start(i)
+    while reader is not None and reader.pending:
+        writer.put(*reversed(reader.finish()))
+    glFinish()
+    render_time = time.perf_counter() - start
+    writer.close()
+    total = time.perf_counter() - start
+
+    print(f"{args.frames} frames {width}x{height}  render loop {args.frames / render_time:.1f} fps")
+    print(f"captured {writer.written} ({writer.dropped} dropped)  "
+          f"sustained {writer.written / total:.1f} fps  "
+          f"{writer.bytes / total / 2 ** 20:.1f} MB/s to {args.out}")
+    if args.format == "raw":
+        print(f"  ffmpeg -f rawvideo -pix_fmt rgba -s {width}x{height} "
+              f"-i {os.path.join(args.out, 'frames.rgba')} -vf vflip out.mp4")
+    if reader is not None:
+        reader.release()
+    fb.release()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
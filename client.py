@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import threading
+import time
+
+import net
+from intense import GameController
+from replay import KEY, MOUSE, SPECIAL
+
+try:
+    from OpenGL.GL import *
+    from OpenGL.GLUT import *
+except ImportError:
+    pass
+
+
+class ThinClient:
+    # Server er snapshot GameRenderer diye draw kore, input server e pathay
+    def __init__(self, host, port, net_hz=30):
+        self.host, self.port = host, port
+        self.net_hz = net_hz
+        self.game = GameController()  # Shudhu renderer and state er jonno, logic chalay na
+        self.lock = threading.Lock()
+        self.latest = None        # Network thread er shesh decode kora (view, frames)
+        self.received = 0.0       # Shesh snapshot kokhon apply hoyeche
+        self.loop = None
+        self.writer = None
+
+    def start(self):
+        # Network alada thread e asyncio loop e chole, GLUT main loop block na kore
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self.receive(), self.loop).result()
+
+    async def receive(self):
+        reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        asyncio.ensure_future(self.read_loop(reader))
+
+    async def read_loop(self, reader):
+        history = {}
+        while True:
+            kind, payload = await net.read_message(reader)
+            if kind != net.SNAP:
+                continue
+            seq, view, frames = net.decode(payload, history)
+            history[seq] = frames
+            for old in [s for s in history if s <= seq - net.HISTORY]:
+                del history[old]
+            self.writer.write(net.pack(net.ACK, net.SEQ.pack(seq)))
+            with self.lock:
+                self.latest = (view, frames)
+
+    def send(self, kind, code):
+        data = net.pack(net.INPUT, net.EVENT.pack(0, kind, code))
+        self.loop.call_soon_threadsafe(self.writer.write, data)
+
+    def keyboard_handler(self, key, *args):
+        self.send(KEY, key[0])
+
+    def special_key_handler(self, key, *args):
+        self.send(SPECIAL, key)
+
+    def mouse_handler(self, button, state, x, y):
+        self.send(MOUSE, button << 8 | state)
+
+    def idle(self):
+        # Notun snapshot ele state e boshay, majhe snapshot er moddhe interpolate kore
+        with self.lock:
+            latest, self.latest = self.latest, None
+        now = time.perf_counter()
+        if latest is not None:
+            self.game.rend.others = net.apply(self.game.cfg.state, *latest)
+            self.received = now
+        self.game.alpha = min(1.0, (now - self.received) * self.net_hz)
+
+        next_draw = self.game.last_draw + 1.0 / self.game.cfg.fps_cap
+        if now >= next_draw:
+            self.game.last_draw = now
+            glutPostRedisplay()
+        else:
+            time.sleep(next_draw - now)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Thin client for server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--net-hz", type=int, default=30,
+                        help="server snapshot rate, used for interpolation")
+    args = parser.parse_args(argv)
+
+    glutInit()
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
+    glutInitWindowSize(1000, 800)
+    glutCreateWindow(b"3D Shooter Game (client)")
+    glEnable(GL_DEPTH_TEST)
+    client = ThinClient(args.host, args.port, args.net_hz)
+    client.start()
+    glutDisplayFunc(client.game.render_scene)
+    glutIdleFunc(client.idle)
+    glutKeyboardFunc(client.keyboard_handler)
+    glutSpecialFunc(client.special_key_handler)
+    glutMouseFunc(client.mouse_handler)
+    glutMainLoop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import numpy as np
+
+
+class SpatialHash:
+    # Arena ke uniform grid e bhag kore, kache thaka entity khuje pete
+    def __init__(self, cell, lo, hi):
+        self.cell = float(cell)   # Prottek cell er size
+        self.lo = float(lo)       # Arena er shuru
+        self.cols = self._cols(cell, lo, hi)
+        # Charpashe ekta faka border rakhe jate neighbour cell shob shomoy valid
+        self.n = self.cols + 2
+        self.neigh = np.array([oy * self.n + ox
+                               for oy in (-1, 0, 1) for ox in (-1, 0, 1)])
+        self.order = np.zeros(0, dtype=np.int64)
+        self.starts = np.zeros(self.n * self.n + 1, dtype=np.int64)
+
+    @staticmethod
+    def _cols(cell, lo, hi):
+        return max(1, int(np.ceil((hi - lo) / cell)))
+
+    def fits(self, cell, lo, hi):
+        # Ei grid ki same settings er jonno banano kina
+        return (self.cell == cell and self.lo == lo and
+                self.cols == self._cols(cell, lo, hi))
+
+    def _keys(self, xs, ys):
+        # Position theke cell er key ber kore, arena er baire thakle edge e clamp kore
+        cx = np.clip((xs - self.lo) // self.cell, 0, self.cols - 1).astype(np.int64)
+        cy = np.clip((ys - self.lo) // self.cell, 0, self.cols - 1).astype(np.int64)
+        return (cy + 1) * self.n + cx + 1
+
+    def build(self, xs, ys):
+        # Entity gulo ke cell onujayi sort kore, prottek cell er range rakhe
+        keys = self._keys(xs, ys)
+        self.order = np.argsort(keys, kind="stable")
+        counts = np.bincount(keys, minlength=self.n * self.n)
+        np.cumsum(counts, out=self.starts[1:])
+
+    def query(self, xs, ys, cap=None):
+        # Prottek query point er ashepasher 3x3 cell er entity gulo pair hishebe dey
+        # cap dile prottek cell theke shudhu prothom cap ta ney (pair er shongkha bounded)
+        keys = self._keys(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+        cells = (keys[:, None] + self.neigh).ravel()
+        start = self.starts[cells]
+        counts = self.starts[cells + 1] - start
+        if cap is not None:
+            counts = np.minimum(counts, cap)
+        total = int(counts.sum())
+        # Prottek cell er range ke ekta flat index array te expand kore
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        slot = np.arange(total) - first + np.repeat(start, counts)
+        qi = np.repeat(np.arange(len(keys)).repeat(len(self.neigh)), counts)
+        return qi, self.order[slot]
+
+
+def first_hits(qi, ei, t):
+    # Prottek query ekta entity ke, prottek entity ekta query ke hit korte pare
+    # Contact er shomoy (t) onujayi resolve kore: je pair tar query and entity duitar
+    # jonnoi shobcheye age, sheta hit; tarpor oder baki pair bad diye abar dekhe,
+    # tai jar prothom entity age nie gese se tar porer contact e jay
+    hit_q, hit_e = [], []
+    while qi.size:
+        order = np.lexsort((ei, qi, t))
+        qi, ei, t = qi[order], ei[order], t[order]
+        _, fq = np.unique(qi, return_index=True)
+        _, fe = np.unique(ei, return_index=True)
+        win = np.intersect1d(fq, fe)
+        hit_q.append(qi[win])
+        hit_e.append(ei[win])
+        keep = ~(np.isin(qi, qi[win]) | np.isin(ei, ei[win]))
+        qi, ei, t = qi[keep], ei[keep], t[keep]
+    if not hit_q:
+        return qi, ei
+    return np.concatenate(hit_q), np.concatenate(hit_e)
+
+
+def sweep_d2(sx, sy, ex, ey):
+    # Relative segment (s theke e) er origin er shobcheye kacher point er squared distance
+    dx, dy = ex - sx, ey - sy
+    dd = dx * dx + dy * dy
+    # Segment er kon jayga origin er shobcheye kache (0 theke 1 er moddhe)
+    t = np.clip(-(sx * dx + sy * dy) / np.where(dd > 0, dd, 1.0), 0.0, 1.0)
+    cx, cy = sx + t * dx, sy + t * dy
+    return cx * cx + cy * cy
+
+
+def sweep_contact(sx, sy, ex, ey, radius):
+    # Relative segment (s theke e) prothom kokhon origin er radius er moddhe dhoke
+    # (0 theke 1 er moddhe), na dhukle inf
+    dx, dy = ex - sx, ey - sy
+    a = dx * dx + dy * dy
+    b = sx * dx + sy * dy
+    c = sx * sx + sy * sy - radius * radius
+    disc = b * b - a * c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (-b - np.sqrt(np.maximum(disc, 0))) / a
+    hit = (disc >= 0) & (a > 0) & (t >= 0) & (t <= 1)
+    # Shuru tei bhitore thakle t = 0
+    return np.where(c <= 0, 0.0, np.where(hit, t, np.inf))
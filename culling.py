@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+
+# Distance onujayi sphere er slices/stacks: (ei distance porjonto, detail)
+LOD_LEVELS = [(900, 10), (1300, 6), (math.inf, 4)]
+
+
+def perspective(fov, aspect, near, far):
+    # gluPerspective er moto projection matrix
+    f = 1.0 / math.tan(math.radians(fov) / 2)
+    return np.array([[f / aspect, 0, 0, 0],
+                     [0, f, 0, 0],
+                     [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+                     [0, 0, -1, 0]])
+
+
+def look_at(eye, center, up):
+    # gluLookAt er moto view matrix
+    eye = np.asarray(eye, dtype=float)
+    fwd = np.asarray(center, dtype=float) - eye
+    fwd /= np.linalg.norm(fwd)
+    side = np.cross(fwd, up)
+    side /= np.linalg.norm(side)
+    upv = np.cross(side, fwd)
+    m = np.identity(4)
+    m[0, :3], m[1, :3], m[2, :3] = side, upv, -fwd
+    m[:3, 3] = -m[:3, :3] @ eye
+    return m
+
+
+class Frustum:
+    def __init__(self):
+        self.planes = np.zeros((6, 4))  # Prottek plane er (a, b, c, d), normalized
+
+    def update(self, fov, aspect, near, far, eye, center, up):
+        # Camera er projection * view theke 6 ta clip plane ber kore
+        m = perspective(fov, aspect, near, far) @ look_at(eye, center, up)
+        planes = np.array([m[3] + m[0], m[3] - m[0],
+                           m[3] + m[1], m[3] - m[1],
+                           m[3] + m[2], m[3] - m[2]])
+        self.planes = planes / np.linalg.norm(planes[:, :3], axis=1)[:, None]
+
+    def visible(self, xs, ys, zs, radius):
+        # Kon sphere gulo kono plane er puro baire na tar mask
+        pts = np.stack([xs, ys, zs, np.ones_like(xs)])
+        dist = self.planes @ pts
+        return (dist >= -radius).all(axis=0)
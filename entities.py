@@ -0,0 +1,123 @@
+import numpy as np
+
+
+def sample_outside(u, lo, hi, gap_lo, gap_hi):
+    # [lo, hi] theke (gap_lo, gap_hi) bad diye uniform sample, u er [0, 1) value theke
+    # Baki duita tukro ke jora lagiye ekta line dhore, tai kono retry lage na
+    left = np.clip(gap_lo, lo, hi) - lo
+    right = hi - np.clip(gap_hi, lo, hi)
+    if left + right <= 0:
+        # Gap puro range dhake dile jei kinara gap theke dure shekhane rakhe
+        return np.full(np.shape(u), lo if gap_lo - lo > hi - gap_hi else hi)
+    t = np.asarray(u) * (left + right)
+    return np.where(t < left, lo + t, hi - (t - left))
+
+
+class EntityStore:
+    # Prottek field er jonno alada contiguous array (structure of arrays)
+    FIELDS = ("x", "y", "z", "dir_x", "dir_y", "prev_x", "prev_y")
+
+    def __init__(self, capacity=64):
+        self.count = 0      # Koyta entity alive ache
+        self.next_id = 0    # Notun entity er id
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity))
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.ids)
+
+    def reserve(self, need):
+        # Jayga na thakle array gulo double kore (ekbar barle ar chhoto hoy na,
+        # tai remove/clear er pore same array gulo abar reuse hoy)
+        if need <= self.capacity:
+            return
+        size = max(need, self.capacity * 2)
+        for name in self.FIELDS + ("ids",):
+            old = getattr(self, name)
+            new = np.zeros(size, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def view(self, name):
+        # Alive entity gulor field er view dey (copy na)
+        return getattr(self, name)[:self.count]
+
+    def add(self, x, y, z=0.0, dir_x=0.0, dir_y=0.0):
+        # Ekta entity add kore and tar index return kore (notun array banay na)
+        i = self.count
+        self.reserve(i + 1)
+        self.x[i], self.y[i], self.z[i] = x, y, z
+        self.dir_x[i], self.dir_y[i] = dir_x, dir_y
+        self.prev_x[i], self.prev_y[i] = x, y
+        self.ids[i] = self.next_id
+        self.next_id += 1
+        self.count = i + 1
+        return i
+
+    def add_many(self, xs, ys, zs=0.0, dir_x=0.0, dir_y=0.0):
+        # Onek entity ekshathe add kore
+        k = len(xs)
+        start, end = self.count, self.count + k
+        self.reserve(end)
+        self.x[start:end] = xs
+        self.y[start:end] = ys
+        self.z[start:end] = zs
+        self.dir_x[start:end] = dir_x
+        self.dir_y[start:end] = dir_y
+        # Notun entity er ager position o ekhon er position
+        self.prev_x[start:end] = self.x[start:end]
+        self.prev_y[start:end] = self.y[start:end]
+        self.ids[start:end] = np.arange(self.next_id, self.next_id + k)
+        self.next_id += k
+        self.count = end
+        return np.arange(start, end)
+
+    def remove(self, indices):
+        # Swap-remove: shesher alive entity gulo diye faka jayga puron kore
+        idx = np.unique(np.asarray(indices, dtype=np.int64))
+        if idx.size == 0:
+            return
+        new_count = self.count - idx.size
+        holes = idx[idx < new_count]
+        tail = np.arange(new_count, self.count)
+        movers = tail[~np.isin(tail, idx)]
+        for name in self.FIELDS + ("ids",):
+            arr = getattr(self, name)
+            arr[holes] = arr[movers]
+        self.count = new_count
+
+    def compact(self, alive):
+        # Alive mask false emon shob entity remove kore
+        self.remove(np.flatnonzero(~np.asarray(alive)))
+
+    def clear(self):
+        self.count = 0
+
+    def save_prev(self):
+        # Tick er age position copy kore (interpolation and swept test er jonno)
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def move(self, speed):
+        # Prottek entity ke tar direction e speed poriman move kore
+        n = self.count
+        self.x[:n] += speed * self.dir_x[:n]
+        self.y[:n] += speed * self.dir_y[:n]
+
+    def outside(self, lo, hi):
+        # Kon entity gulo [lo, hi] square er baire ache tar mask
+        x, y = self.view("x"), self.view("y")
+        return (x < lo) | (x > hi) | (y < lo) | (y > hi)
+
+    def lerp(self, alpha):
+        # Ager and ekhon er tick er majhe interpolated position
+        px, py = self.view("prev_x"), self.view("prev_y")
+        return (px + (self.view("x") - px) * alpha,
+                py + (self.view("y") - py) * alpha,
+                self.view("z"))
@@ -0,0 +1,77 @@
+import argparse
+import random
+import time
+
+from intense import GameController
+
+
+class HeadlessEngine:
+    def __init__(self, seed=None, enemies=None, auto_shoot=False,
+                 auto_aim=False, fp=False):
+        # Window chara game logic chalanor jonno controller banay
+        if seed is not None:
+            random.seed(seed)
+        self.game = GameController()
+        self.cfg = self.game.cfg
+        self.logic = self.game.logic
+
+        if enemies is not None:
+            self.cfg.max_e = enemies
+        # Keyboard/mouse toggle er moto mode gulo set kore
+        self.cfg.fp = fp
+        self.cfg.turn_spd = 2.5 if fp else 5
+        self.cfg.auto_shoot = auto_shoot
+        self.cfg.e_hitbox = 40 if auto_shoot else 60
+        self.cfg.auto_aim = auto_aim and fp and auto_shoot
+
+        self.game.start_game()
+        self.ticks = 0
+
+    def step(self, n=1, stride=1):
+        # n ta tick simulate kore, game over hole theme jay
+        # stride > 1 hole ek logic pass e stride ta tick fast-forward kore
+        done = 0
+        while done < n and not self.cfg.over:
+            k = self.logic.tick(min(stride, n - done))
+            # Headless e prottek logic pass ekta profiler frame
+            self.logic.prof.count("enemies", len(self.cfg.enemies))
+            self.logic.prof.count("bullets", len(self.cfg.bullets))
+            self.logic.prof.end_frame()
+            done += k
+        self.ticks += done
+        return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless game simulation")
+    parser.add_argument("--ticks", type=int, default=100000)
+    parser.add_argument("--enemies", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--stride", type=int, default=1,
+                        help="ticks simulated per logic pass")
+    parser.add_argument("--auto-shoot", action="store_true")
+    parser.add_argument("--auto-aim", action="store_true")
+    parser.add_argument("--fp", action="store_true")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="time every phase and dump to PATH (.csv/.json)")
+    args = parser.parse_args(argv)
+
+    engine = HeadlessEngine(seed=args.seed, enemies=args.enemies,
+                            auto_shoot=args.auto_shoot,
+                            auto_aim=args.auto_aim, fp=args.fp)
+    engine.logic.prof.enable(bool(args.profile))
+    start = time.perf_counter()
+    ran = engine.step(args.ticks, args.stride)
+    elapsed = time.perf_counter() - start
+
+    cfg = engine.cfg
+    rate = ran / elapsed if elapsed > 0 else float("inf")
+    print(f"ticks: {ran}  time: {elapsed:.3f}s  ticks/sec: {rate:.0f}")
+    print(f"score: {cfg.score}  hp: {cfg.hp}  misses: {cfg.misses}"
+          f"  over: {cfg.over}")
+    if args.profile:
+        engine.logic.prof.dump(args.profile)
+
+
+if __name__ == "__main__":
+    main()
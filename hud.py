@@ -0,0 +1,136 @@
+try:
+    from OpenGL.GL import *
+    from OpenGL.GLU import *
+    from OpenGL.GLUT import *
+except ImportError:
+    # Headless mode e HUD lage na, shudhu class ta import hoy
+    pass
+
+FIRST, LAST = 32, 127  # Printable ASCII character gulo atlas e rakhe
+
+
+class Hud:
+    def __init__(self, font, cell=24, cols=16, pad=2, base=6):
+        self.font = font
+        self.cell = cell      # Atlas e prottek glyph er box
+        self.cols = cols      # Atlas er proti row te koyta glyph
+        self.pad = pad        # Box er bam dik theke glyph koto dure
+        self.base = base      # Box er nich theke baseline koto upore
+        self.rows = (LAST - FIRST + cols - 1) // cols
+        self.tex = None       # Glyph atlas texture
+        self.widths = {}      # Prottek glyph er advance width
+        self.list = None      # HUD quad er display list
+        self.key = None       # Kon text er jonno list banano
+
+    def build(self, scr_w, scr_h):
+        # Glyph gulo ekbar back buffer e eke texture atlas e copy kore
+        if self.tex is not None:
+            return
+        w, h = self.cols * self.cell, self.rows * self.cell
+
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        gluOrtho2D(0, scr_w, 0, scr_h)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_SCISSOR_BIT)
+        glDisable(GL_DEPTH_TEST)
+
+        # Atlas er jayga ta faka kore prottek glyph nijer box e ake
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(0, 0, w, h)
+        glClearColor(0, 0, 0, 0)
+        glClear(GL_COLOR_BUFFER_BIT)
+        glColor3f(1, 1, 1)
+        for ch in range(FIRST, LAST):
+            i = ch - FIRST
+            glRasterPos2f((i % self.cols) * self.cell + self.pad,
+                          (i // self.cols) * self.cell + self.base)
+            glutBitmapCharacter(self.font, ch)
+            self.widths[ch] = glutBitmapWidth(self.font, ch)
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        pixels = glReadPixels(0, 0, w, h, GL_RED, GL_UNSIGNED_BYTE)
+
+        glPopAttrib()
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+
+        # Red channel ke alpha texture hishebe upload kore
+        self.tex = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.tex)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA, w, h, 0,
+                     GL_ALPHA, GL_UNSIGNED_BYTE, pixels)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+    def draw(self, lines, scr_w, scr_h):
+        # Text bodlale notun quad list banay, na hole ager list call kore
+        key = (tuple(lines), scr_w, scr_h)
+        if key != self.key:
+            if self.list is None:
+                self.list = glGenLists(1)
+            glNewList(self.list, GL_COMPILE)
+            self.emit(lines, scr_w, scr_h)
+            glEndList()
+            self.key = key
+        glCallList(self.list)
+
+    def emit(self, lines, scr_w, scr_h):
+        # Shob line er glyph quad ek glBegin/glEnd e draw kore
+        w, h = self.cols * self.cell, self.rows * self.cell
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        gluOrtho2D(0, scr_w, 0, scr_h)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_TEXTURE_BIT)
+        glDisable(GL_DEPTH_TEST)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.tex)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glColor3f(1, 1, 1)  # Text er color white
+
+        glBegin(GL_QUADS)
+        for x, y, text in lines:
+            for ch in map(ord, text):
+                if ch not in self.widths:
+                    continue
+                i = ch - FIRST
+                u0 = (i % self.cols) * self.cell / w
+                v0 = (i // self.cols) * self.cell / h
+                u1, v1 = u0 + self.cell / w, v0 + self.cell / h
+                # Glyph er box ke baseline onujayi screen e boshay
+                x0, y0 = x - self.pad, y - self.base
+                x1, y1 = x0 + self.cell, y0 + self.cell
+                glTexCoord2f(u0, v0); glVertex2f(x0, y0)
+                glTexCoord2f(u1, v0); glVertex2f(x1, y0)
+                glTexCoord2f(u1, v1); glVertex2f(x1, y1)
+                glTexCoord2f(u0, v1); glVertex2f(x0, y1)
+                x += self.widths[ch]
+        glEnd()
+
+        glPopAttrib()
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+
+    def release(self):
+        # Texture and display list free kore
+        if self.tex is not None:
+            glDeleteTextures([self.tex])
+            self.tex = None
+        if self.list is not None:
+            glDeleteLists(self.list, 1)
+            self.list = None
+        self.key = None
@@ -1,9 +1,36 @@
-from OpenGL.GL import *
-from OpenGL.GLUT import *
-from OpenGL.GLU import *
-from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_18
+import argparse
+import atexit
 import math
 import random
+import time
+
+import numpy as np
+
+from collision import SpatialHash, first_hits, sweep_contact, sweep_d2
+from culling import LOD_LEVELS, Frustum
+from entities import sample_outside
+from hud import Hud
+from meshes import BatchRenderer, MeshCache, bullet_template, enemy_template
+from navigation import FlowField
+from profiler import FrameProfiler
+from state import GameState
+from targeting import Targeter, claimed, lead_point
+
+SEP_MAX = 0.75    # Separation er jor seek (1) er cheye kom, jate bhir eo player er dike jay
+STEER_SLICE = 4096 # Eto enemy er beshi hole steering nav_every tick e bhag kore
+HOLD = -2         # aim_id: shob candidate e bullet jacche, fire thamiye rakhe
+
+try:
+    from OpenGL.GL import *
+    from OpenGL.GLUT import *
+    from OpenGL.GLU import *
+    from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_18
+except ImportError:
+    # OpenGL na thakle shudhu headless mode e game logic chalano jay
+    GLUT_BITMAP_HELVETICA_18 = None
+    # Replay er jonno input er GLUT constant gulo
+    GLUT_KEY_LEFT, GLUT_KEY_UP, GLUT_KEY_RIGHT, GLUT_KEY_DOWN = 100, 101, 102, 103
+    GLUT_LEFT_BUTTON, GLUT_RIGHT_BUTTON, GLUT_DOWN = 0, 2, 0
 
 class GameConfig:
     def __init__(self):
@@ -13,45 +40,65 @@ class GameConfig:
         self.arena = 600   # Game arena er size
         self.fov = 120     # Camera er field of view
 
-        # Camera er position and rotation settings
+        # Camera er position settings
         self.cam_pos = [0, 600, 600]  # Camera kothay ache
-        self.cam_rot = 0              # Camera er rotation angle
-        self.cam_dist = 600           # Camera er distance from center
-        self.cam_elev = 600           # Camera er elevation (upor niche)
 
         # Player er properties
-        self.p_pos = [0, 0, 0]  # Player er position
-        self.p_rot = 0          # Player er rotation
         self.p_spd = 10         # Player er movement speed
-        self.turn_spd = 5       # Player er turning speed
-        self.hp = 5             # Player er health
-        self.score = 0          # Player er score
+        self.p_hitbox = 50      # Enemy player ke kotota kache ashle damage kore
 
         # Weapon and bullet related settings
-        self.bullets = []       # Bullet er list
-        self.misses = 0         # Missed shot er count
         self.max_miss = 10      # Maximum allowed missed shots
         self.bullet_sz = 7.5    # Bullet er size
         self.bullet_spd = 1     # Bullet er speed
 
         # Enemy related settings
-        self.enemies = []       # Enemy er list
-        self.e_scale = 1.0      # Enemy er size scale
-        self.e_timer = 0        # Enemy animation er timer
         self.e_spd = 0.025      # Enemy er movement speed
         self.max_e = 5          # Maximum number of enemies
-        self.e_hitbox = 60      # Enemy er hitbox size
+        self.nav_cell = 50      # Flow field er cell size
+        self.sep_weight = 0.5   # Separation er jor, SEP_MAX porjonto (0 hole off)
+        self.nav_every = 10     # Enemy er steering koto tick por por update hoy
+        self.aim_cd = 10        # Auto aim duita fire er majhe koto tick wait kore
 
-        # Game state flags
-        self.fp = False         # First person view on/off
-        self.auto_shoot = False # Auto shooting on/off
-        self.auto_aim = False   # Auto aiming on/off
-        self.over = False       # Game over status
+        # Fixed timestep loop er settings
+        self.sim_hz = 500       # Proti second e koto logic tick
+        self.fps_cap = 120      # Proti second e maximum koto frame draw
+        self.max_lag = 0.25     # Ek frame e maximum koto second catch up
+
+        # Game cholar shomoy je value bodlay (position, hp, score, entity...)
+        self.state = GameState()
+
+def _bind_state(cls):
+    # cfg.hp er moto access state er slot e pathay (input/render er jonno;
+    # logic er hot path shoja cfg.state use kore)
+    def live(name):
+        return property(lambda self: getattr(self.state, name),
+                        lambda self, value: setattr(self.state, name, value))
+
+    for name in GameState.__slots__:
+        setattr(cls, name, live(name))
+
+_bind_state(GameConfig)
 
 class GameRenderer:
     def __init__(self, cfg):
         self.cfg = cfg  # Game config store kore
         self.wpn_off = [30, 15, 80]  # Weapon er offset position
+        self.arena_list = None       # Arena er display list
+        self.arena_key = None        # Kon arena size er jonno list banano
+        self.meshes = MeshCache()    # Player and enemy er cached mesh
+        # Shob enemy/bullet ek draw call e draw korar batch (enemy er detail level onujayi)
+        self.enemy_batches = {}
+        self.bullet_batch = None
+        self.bullet_sz = None        # Bullet batch kon size er jonno banano
+        self.hud = Hud(GLUT_BITMAP_HELVETICA_18)  # Glyph atlas diye HUD text
+        self.others = ()             # Server er onno player der (x, y, rot)
+        self.near, self.far = 0.1, 1500  # Camera er near and far plane
+        self.eye = (0, 0, 0)         # Camera kothay ache
+        self.frustum = Frustum()     # Camera te ki dekha jay
+        # Proti frame e koto entity culled/kom detail e draw hoyeche
+        self.stats = {"enemies_culled": 0, "enemies_lowered": 0, "bullets_culled": 0,
+                      "draw_calls": 0}
 
     def show_text(self, x, y, text, font=GLUT_BITMAP_HELVETICA_18):
         # Screen e text dekhay specific position e
@@ -76,7 +123,25 @@ class GameRenderer:
         glPopMatrix()       # Projection matrix restore kore
         glMatrixMode(GL_MODELVIEW)  # Modelview matrix e fire jay
 
+    def draw_hud(self, lines):
+        # HUD er shob line ekshathe draw kore, value na bodlale cached list use kore
+        self.hud.draw(lines, self.cfg.scr_w, self.cfg.scr_h)
+        self.stats["draw_calls"] += 1
+
     def draw_arena(self):
+        # Arena bodlay na, tai ekbar display list e bake kore pore shudhu call kore
+        if self.arena_list is None or self.arena_key != self.cfg.arena:
+            if self.arena_list is not None:
+                glDeleteLists(self.arena_list, 1)
+            self.arena_list = glGenLists(1)
+            self.arena_key = self.cfg.arena
+            glNewList(self.arena_list, GL_COMPILE)
+            self.emit_arena()
+            glEndList()
+        glCallList(self.arena_list)
+        self.stats["draw_calls"] += 1
+
+    def emit_arena(self):
         # Game arena er floor and walls draw kore
         glBegin(GL_QUADS)
 
@@ -109,18 +174,8 @@ class GameRenderer:
 
         glEnd()
 
-    def setup_view(self):
-        # Camera view set kore
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()    # Projection matrix reset kore
-        # Perspective projection set kore
-        gluPerspective(self.cfg.fov,
-                      float(self.cfg.scr_w)/self.cfg.scr_h,
-                      0.1, 1500)
-
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()    # Modelview matrix reset kore
-
+    def camera(self):
+        # Camera er eye, look-at point and up vector calculate kore
         if self.cfg.fp:
             # First person view setup kore
             angle = math.radians(self.cfg.p_rot)
@@ -136,24 +191,40 @@ class GameRenderer:
             # Look-at point calculate kore
             look_x = eye_x - math.sin(-angle) * 100
             look_y = eye_y - math.cos(-angle) * 100
-            gluLookAt(eye_x, eye_y, eye_z, look_x, look_y, eye_z, 0, 0, 1)
-        else:
-            # Third person view setup kore
-            angle = math.radians(self.cfg.cam_rot)
-            # Camera position calculate kore distance and angle er upor
-            cam_x = self.cfg.cam_dist * math.sin(angle)
-            cam_y = self.cfg.cam_dist * math.cos(angle)
-            gluLookAt(cam_x, cam_y, self.cfg.cam_elev, 0, 0, 0, 0, 0, 1)
-
-    def draw_player(self):
-        # Player character draw kore
+            return (eye_x, eye_y, eye_z), (look_x, look_y, eye_z), (0, 0, 1)
+        # Third person view setup kore
+        angle = math.radians(self.cfg.cam_rot)
+        # Camera position calculate kore distance and angle er upor
+        cam_x = self.cfg.cam_dist * math.sin(angle)
+        cam_y = self.cfg.cam_dist * math.cos(angle)
+        return (cam_x, cam_y, self.cfg.cam_elev), (0, 0, 0), (0, 0, 1)
+
+    def setup_view(self):
+        # Camera view set kore
+        aspect = float(self.cfg.scr_w)/self.cfg.scr_h
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()    # Projection matrix reset kore
+        # Perspective projection set kore
+        gluPerspective(self.cfg.fov, aspect, self.near, self.far)
+
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()    # Modelview matrix reset kore
+
+        eye, look, up = self.camera()
+        gluLookAt(*eye, *look, *up)
+        # Same camera theke culling er frustum update kore
+        self.eye = eye
+        self.frustum.update(self.cfg.fov, aspect, self.near, self.far, eye, look, up)
+
+    def draw_player(self, pos=None, rot=None, over=None):
+        # Player character draw kore (default nijer player, na hole server er onno player)
         glPushMatrix()
         # Player ke world e position and rotate kore
-        glTranslatef(*self.cfg.p_pos)
-        glRotatef(self.cfg.p_rot, 0, 0, 1)
+        glTranslatef(*(self.cfg.p_pos if pos is None else pos))
+        glRotatef(self.cfg.p_rot if rot is None else rot, 0, 0, 1)
 
         # Game over hole player ke shuye dekhay
-        if self.cfg.over:
+        if self.cfg.over if over is None else over:
             glRotatef(-90, 1, 0, 0)
 
         # Right leg draw kore
@@ -161,7 +232,7 @@ class GameRenderer:
         glTranslatef(0, -60, 15)  # Right leg at player’s origin
         glColor3f(0.0, 0.0, 1.0)   # Blue color
         glRotatef(-90, 1, 0, 0)
-        gluCylinder(gluNewQuadric(), 5, 10, 50, 10, 10)
+        self.meshes.draw("leg")
         glPopMatrix()
 
         # Left leg draw kore
@@ -169,20 +240,20 @@ class GameRenderer:
         glTranslatef(30, -60, 15)  # Left leg 30 units to the right
         glColor3f(0.0, 0.0, 1.0)   # Blue color
         glRotatef(-90, 1, 0, 0)
-        gluCylinder(gluNewQuadric(), 5, 10, 50, 10, 10)
+        self.meshes.draw("leg")
         glPopMatrix()
 
         # Body draw kore
         glPushMatrix()
         glTranslatef(15, 0, 50)
         glColor3f(85/255, 108/255, 47/255)  # Olive green color
-        glutSolidCube(40)
+        self.meshes.draw("body")
 
         # Head draw kore
         glPushMatrix()
         glTranslatef(0, 0, 40)
         glColor3f(0.0, 0.0, 0.0)   # Black color
-        gluSphere(gluNewQuadric(), 20, 10, 10)
+        self.meshes.draw("head")
         glPopMatrix()
 
         # Left arm draw kore
@@ -190,7 +261,7 @@ class GameRenderer:
         glTranslatef(20, -60, 25)
         glRotatef(-90, 1, 0, 0)
         glColor3f(254/255, 223/255, 188/255)  # Skin color
-        gluCylinder(gluNewQuadric(), 4, 8, 50, 10, 10)
+        self.meshes.draw("arm")
         glPopMatrix()
 
         # Right arm draw kore
@@ -198,7 +269,7 @@ class GameRenderer:
         glTranslatef(-20, -60, 25)
         glRotatef(-90, 1, 0, 0)
         glColor3f(254/255, 223/255, 188/255)  # Skin color
-        gluCylinder(gluNewQuadric(), 4, 8, 50, 10, 10)
+        self.meshes.draw("arm")
         glPopMatrix()
 
         # Weapon draw kore
@@ -206,189 +277,393 @@ class GameRenderer:
         glTranslatef(0, -90, 0)  # Weapon ke chest er center e position kore
         glRotatef(-90, 1, 0, 0)  # Weapon ke rotate kore
         glColor3f(192/255, 192/255, 192/255)  # Silver color set kore
-        gluCylinder(gluNewQuadric(), 1, 10, 80, 10, 10)  # Cylinder draw kore as weapon
+        self.meshes.draw("weapon")  # Cylinder draw kore as weapon
         glPopMatrix()
 
         glPopMatrix()
         glPopMatrix()
-
-    def draw_projectile(self, x, y, z):
-        # Specific position e bullet draw kore
-        glPushMatrix()
-        glTranslatef(x, y, z)
-        glRotatef(-90, 1, 0, 0)
-        glColor3f(1, 0, 0)  # Red color
-        glutSolidCube(self.cfg.bullet_sz)
-        glPopMatrix()
-
-    def draw_enemy(self, x, y, z):
-        # Specific position e enemy draw kore
-        glPushMatrix()
-        glTranslatef(x, y, z + 35)
-        # Animation er jonno scale apply kore
-        glScalef(self.cfg.e_scale, self.cfg.e_scale, self.cfg.e_scale)
-        glColor3f(1, 0, 0)  # Red color for body
-        gluSphere(gluNewQuadric(), 35, 10, 10)
-        glTranslatef(0, 0, 50)
-        glColor3f(0, 0, 0)  # Black color for head
-        gluSphere(gluNewQuadric(), 15, 10, 10)
-        glPopMatrix()
+        self.stats["draw_calls"] += 7  # 6 ta mesh and body er cube
+
+    def draw_enemies(self, xs, ys, zs):
+        # Camera te dekha jay emon enemy gulo distance onujayi detail level e draw kore
+        s = self.cfg.e_scale
+        # Body and head ke dhore rakhe emon bounding sphere
+        cz = zs + 35 + 15 * s
+        seen = np.flatnonzero(self.frustum.visible(xs, ys, cz, 50 * s))
+        self.stats["enemies_culled"] = len(xs) - len(seen)
+
+        dist = np.sqrt((xs[seen] - self.eye[0]) ** 2 + (ys[seen] - self.eye[1]) ** 2 +
+                       (cz[seen] - self.eye[2]) ** 2)
+        level = np.searchsorted([d for d, _ in LOD_LEVELS], dist)
+        self.stats["enemies_lowered"] = int(np.count_nonzero(level))
+        for lvl, (_, detail) in enumerate(LOD_LEVELS):
+            pick = seen[level == lvl]
+            if pick.size:
+                if detail not in self.enemy_batches:
+                    self.enemy_batches[detail] = BatchRenderer(*enemy_template(detail))
+                self.enemy_batches[detail].draw(xs[pick], ys[pick], zs[pick] + 35, s)
+                self.stats["draw_calls"] += 1
+
+    def draw_projectiles(self, xs, ys, zs):
+        # Shob bullet ekshathe draw kore, bullet size bodlale batch notun banay
+        if self.bullet_batch is None or self.bullet_sz != self.cfg.bullet_sz:
+            if self.bullet_batch is not None:
+                self.bullet_batch.release()
+            self.bullet_sz = self.cfg.bullet_sz
+            self.bullet_batch = BatchRenderer(*bullet_template(self.bullet_sz))
+        # Camera er baire thaka bullet bad dey
+        seen = self.frustum.visible(xs, ys, zs, self.cfg.bullet_sz)
+        self.stats["bullets_culled"] = len(xs) - int(np.count_nonzero(seen))
+        self.bullet_batch.draw(xs[seen], ys[seen], zs[seen])
+        self.stats["draw_calls"] += 1
 
 class GameLogic:
     def __init__(self, cfg, rend):
         self.cfg = cfg    # Game config store kore
         self.rend = rend  # Renderer store kore
-
-    def fire_weapon(self):
-        # Notun bullet create kore
-        angle = math.radians(self.cfg.p_rot + (45 if self.cfg.fp else -90))
-
-        if self.cfg.fp:
+        self.grid = None  # Collision er jonno spatial hash
+        self.field = None      # Enemy navigation er flow field
+        self.nav_target = None # Flow field kon player position er jonno update hoyeche
+        self.p_prev = cfg.p_pos[:2]  # Ager tick e player kothay chilo
+        self.prof = FrameProfiler()  # Phase gulor timing (default off)
+        self.targeter = Targeter()   # Auto aim er bearing index
+        self.rng = random  # Spawn er random (server er shared world nijer seeded Random dey)
+
+    def tick(self, steps=1):
+        # Ek tick e game er shob logic phase chalay, steps > 1 hole fast-forward kore;
+        # asholei koyta tick simulate holo ta return kore
+        st = self.cfg.state
+        if steps > 1 and st.auto_shoot:
+            # Auto shoot prottek tick e aim and fire kore, tai batch ke single tick e
+            # bhange jate stride e result na bodlay (game over er tick ei theme jay)
+            done = 0
+            while done < steps and not st.over:
+                self.tick()
+                done += 1
+            return done
+        self.prof.begin()
+        self.advance_enemies(steps)
+        self.advance_player(steps)
+        return steps
+
+    def advance_enemies(self, steps=1):
+        # Enemy der phase (server er shared world e shob player er jonno ekbar chole)
+        prof = self.prof
+        self.cfg.state.enemies.save_prev()
+        self.update_enemies(steps)
+        prof.lap("update_enemies")
+        self.animate_enemies(steps)
+        prof.lap("animate_enemies")
+
+    def advance_player(self, steps=1):
+        # Ei player er phase: nijer bullet, collision and auto aim
+        st = self.cfg.state
+        prof = self.prof
+        st.bullets.save_prev()
+        self.p_prev = st.p_pos[:2]
+        self.update_projectiles(steps)
+        prof.lap("update_projectiles")
+        self.check_collisions(steps)
+        prof.lap("check_collisions")
+        self.cull_projectiles()
+        prof.lap("cull_projectiles")
+        # Auto aim logic tick e chole, render er upor depend kore na
+        self.auto_aim(steps)
+        prof.lap("auto_aim")
+
+    def muzzle(self):
+        # Bullet kothay theke ber hoy (weapon er offset dhore)
+        st = self.cfg.state
+        angle = math.radians(st.p_rot + (45 if st.fp else -90))
+
+        if st.fp:
             # First person view te bullet er starting position
-            x = self.cfg.p_pos[0] + self.rend.wpn_off[0] * math.sin(angle) - self.rend.wpn_off[1] * math.cos(angle)
-            y = self.cfg.p_pos[1] - self.rend.wpn_off[0] * math.cos(angle) - self.rend.wpn_off[1] * math.sin(angle)
-            z = self.cfg.p_pos[2] + self.rend.wpn_off[2]
+            x = st.p_pos[0] + self.rend.wpn_off[0] * math.sin(angle) - self.rend.wpn_off[1] * math.cos(angle)
+            y = st.p_pos[1] - self.rend.wpn_off[0] * math.cos(angle) - self.rend.wpn_off[1] * math.sin(angle)
+            z = st.p_pos[2] + self.rend.wpn_off[2]
         else:
             # Third person view te bullet er starting position
             offset_x = self.rend.wpn_off[0] * math.cos(angle) - self.rend.wpn_off[1] * math.sin(angle)
             offset_y = self.rend.wpn_off[0] * math.sin(angle) + self.rend.wpn_off[1] * math.cos(angle)
-            x = self.cfg.p_pos[0] + offset_x
-            y = self.cfg.p_pos[1] + offset_y
-            z = self.cfg.p_pos[2] + self.rend.wpn_off[2]
-
-        # Bullet ke list e add kore
-        self.cfg.bullets.append([x, y, z, self.cfg.p_rot])
-
-    def update_projectiles(self):
-        # Bullet er position update kore and arena er baire gele remove kore
-        to_remove = []
-
-        for bullet in self.cfg.bullets:
-            # Bullet ke tar direction e move kore
-            angle = math.radians(bullet[3] - 90)
-            bullet[0] += self.cfg.bullet_spd * math.cos(angle)
-            bullet[1] += self.cfg.bullet_spd * math.sin(angle)
-
-            # Bullet arena er baire gele check kore
-            if (bullet[0] > self.cfg.arena + 100 or
-                bullet[0] < -self.cfg.arena or
-                bullet[1] > self.cfg.arena + 100 or
-                bullet[1] < -self.cfg.arena):
-                to_remove.append(bullet)
-                self.cfg.misses += 1
-                # Max missed shots check kore
-                if self.cfg.misses >= self.cfg.max_miss:
-                    self.cfg.over = True
-
-        # Out of bounds bullet remove kore
-        for bullet in to_remove:
-            self.cfg.bullets.remove(bullet)
-
-    def check_collisions(self):
-        # Bullet and enemy er collision check kore
-        hit_enemies = []
-        hit_bullets = []
-
-        for bullet in self.cfg.bullets:
-            for enemy in self.cfg.enemies:
-                # Bullet and enemy er distance calculate kore
-                dx = bullet[0] - enemy[0]
-                dy = bullet[1] - enemy[1]
-                distance = (dx**2 + dy**2) ** 0.5
-
-                # Bullet enemy ke hit koreche kina check kore
-                if distance <= self.cfg.e_hitbox:
-                    hit_enemies.append(enemy)
-                    hit_bullets.append(bullet)
-                    self.cfg.score += 1
-                    break
-
-        # Hit enemy remove kore and notun spawn kore
-        for enemy in hit_enemies:
-            self.cfg.enemies.remove(enemy)
-            self.spawn_enemies(1)
-
-        # Hit bullet remove kore
-        for bullet in hit_bullets:
-            self.cfg.bullets.remove(bullet)
-
-        # Player and enemy er collision check kore
-        to_remove = []
-        for enemy in self.cfg.enemies:
-            # Player and enemy er distance calculate kore
-            dx = self.cfg.p_pos[0] - enemy[0]
-            dy = self.cfg.p_pos[1] - enemy[1]
-            distance = (dx**2 + dy**2) ** 0.5
-
-            # Enemy player ke hit koreche kina check kore
-            if distance < 50:
-                self.cfg.hp -= 1
-                to_remove.append(enemy)
-                # Player er health shesh hole game over
-                if self.cfg.hp <= 0:
-                    self.cfg.over = True
-                    break
-
-        # Player ke hit kora enemy remove kore and notun spawn kore
-        for enemy in to_remove:
-            self.cfg.enemies.remove(enemy)
-            self.spawn_enemies(1)
+            x = st.p_pos[0] + offset_x
+            y = st.p_pos[1] + offset_y
+            z = st.p_pos[2] + self.rend.wpn_off[2]
+        return x, y, z
 
-    def spawn_enemies(self, count=1):
-        # Random position e notun enemy spawn kore
-        for _ in range(count):
-            while True:
-                # Random position generate kore
-                x = random.uniform(-self.cfg.arena + 100, self.cfg.arena - 100)
-                y = random.uniform(-self.cfg.arena + 100, self.cfg.arena - 100)
-                # Enemy player er kache na thake ensure kore
-                if (abs(x - self.cfg.p_pos[0]) > 200 and
-                    abs(y - self.cfg.p_pos[1]) > 200):
-                    self.cfg.enemies.append([x, y, 0])
-                    break
-
-    def update_enemies(self):
-        # Enemy ke player er dike move kore
-        for enemy in self.cfg.enemies:
-            # Player er direction calculate kore
-            dx = self.cfg.p_pos[0] - enemy[0]
-            dy = self.cfg.p_pos[1] - enemy[1]
-            angle = math.atan2(dy, dx)
-            # Enemy ke oi direction e move kore
-            enemy[0] += self.cfg.e_spd * math.cos(angle)
-            enemy[1] += self.cfg.e_spd * math.sin(angle)
-
-    def animate_enemies(self):
-        # Enemy er size sine wave use kore animate kore
-        self.cfg.e_timer += 0.01
-        self.cfg.e_scale = 1.0 + 0.5 * math.sin(self.cfg.e_timer)
+    def fire_weapon(self):
+        # Notun bullet create kore
+        st = self.cfg.state
+        x, y, z = self.muzzle()
+
+        # Bullet er direction ekbar e calculate kore store e add kore
+        heading = math.radians(st.p_rot - 90)
+        st.bullets.add(x, y, z, math.cos(heading), math.sin(heading))
+
+    def update_projectiles(self, steps=1):
+        # Shob bullet ke tar direction e ekshathe move kore
+        st = self.cfg.state
+        if len(st.bullets):
+            st.bullets.move(self.cfg.bullet_spd * steps)
+
+    def cull_projectiles(self):
+        # Arena er baire chole jawa bullet miss hishebe remove kore
+        st = self.cfg.state
+        bullets = st.bullets
+        if not len(bullets):
+            return
 
-    def auto_aim(self):
-        # Auto aim enable thakle closest enemy te aim kore
-        if not self.cfg.enemies or not self.cfg.auto_shoot:
+        # Bullet arena er baire gele check kore
+        out = bullets.outside(-self.cfg.arena, self.cfg.arena + 100)
+        missed = int(np.count_nonzero(out))
+        if missed:
+            st.misses += missed
+            # Max missed shots check kore
+            if st.misses >= self.cfg.max_miss:
+                st.over = True
+            # Out of bounds bullet remove kore
+            bullets.compact(~out)
+
+    def collision_grid(self, steps=1):
+        # Ek tick e bullet and enemy joto dur jete pare tar upor grid er cell size
+        st = self.cfg.state
+        reach = self.cfg.bullet_spd * steps / 2 + self.cfg.e_spd * steps
+        cell = max(st.e_hitbox, self.cfg.p_hitbox) + reach
+        lo, hi = -self.cfg.arena, self.cfg.arena + 100
+        if self.grid is None or not self.grid.fits(cell, lo, hi):
+            self.grid = SpatialHash(cell, lo, hi)
+        return self.grid
+
+    def check_collisions(self, steps=1):
+        # Bullet and enemy er collision check kore, puro tick er movement dhore
+        st = self.cfg.state
+        bullets, enemies = st.bullets, st.enemies
+        if not len(enemies):
             return
 
-        closest = None
-        min_diff = 360
+        if len(bullets):
+            # Enemy gulo ke grid e rakhe, bullet er path er majhkhan theke khoje
+            grid = self.collision_grid(steps)
+            ex, ey = enemies.view("x"), enemies.view("y")
+            bx, by = bullets.view("x"), bullets.view("y")
+            bpx, bpy = bullets.view("prev_x"), bullets.view("prev_y")
+            grid.build(ex, ey)
+            bi, ei = grid.query((bx + bpx) / 2, (by + bpy) / 2)
+
+            # Enemy er shapekkhe bullet er path kokhon hitbox e dhoke, sei shomoy
+            # onujayi hit thik kore (stride boro holeo kacher enemy agey mare)
+            epx, epy = enemies.view("prev_x")[ei], enemies.view("prev_y")[ei]
+            t = sweep_contact(bpx[bi] - epx, bpy[bi] - epy,
+                              bx[bi] - ex[ei], by[bi] - ey[ei], st.e_hitbox)
+            inside = np.isfinite(t)
+            bi, ei = first_hits(bi[inside], ei[inside], t[inside])
+
+            # Hit enemy and bullet ekshathe remove kore and notun enemy spawn kore
+            if ei.size:
+                st.score += ei.size
+                enemies.remove(ei)
+                bullets.remove(bi)
+                self.spawn_enemies(ei.size)
+
+        # Player and enemy er collision check kore (ek player, tai grid lage na)
+        px, py = st.p_pos[0], st.p_pos[1]
+        d2 = sweep_d2(enemies.view("prev_x") - self.p_prev[0],
+                      enemies.view("prev_y") - self.p_prev[1],
+                      enemies.view("x") - px, enemies.view("y") - py)
+        hits = np.flatnonzero(d2 < self.cfg.p_hitbox ** 2)
+        if hits.size:
+            # Player er health shesh hole baki enemy ar damage kore na
+            hits = hits[:max(st.hp, 0)]
+            st.hp -= hits.size
+            if st.hp <= 0:
+                st.over = True
+            # Player ke hit kora enemy remove kore and notun spawn kore
+            enemies.remove(hits)
+            self.spawn_enemies(hits.size)
 
-        # Closest enemy er angle find kore
-        for enemy in self.cfg.enemies:
-            dx = self.cfg.p_pos[0] - enemy[0]
-            dy = self.cfg.p_pos[1] - enemy[1]
-            angle = math.degrees(math.atan2(dy, dx)) % 360
-            diff = min((self.cfg.p_rot - angle) % 360,
-                      (angle - self.cfg.p_rot) % 360)
+    def spawn_enemies(self, count=1):
+        # Random position e ekshathe count ta enemy spawn kore
+        st = self.cfg.state
+        if count <= 0:
+            return
+        # Replay and snapshot er jonno default e random module thekei number ney
+        u = np.array([self.rng.random() for _ in range(2 * count)])
+        lo, hi = -self.cfg.arena + 100, self.cfg.arena - 100
+        # Player er 200 er moddhe x or y na pore, sei region theke shoja sample kore
+        px, py = st.p_pos[0], st.p_pos[1]
+        xs = sample_outside(u[:count], lo, hi, px - 200, px + 200)
+        ys = sample_outside(u[count:], lo, hi, py - 200, py + 200)
+        # Notun enemy prothom theke field er dike jay, nijer steering er tick porjonto
+        # dariye thake na
+        dx, dy = self.navigate().sample(xs, ys)
+        st.enemies.add_many(xs, ys, 0, dx, dy)
+
+    def update_enemies(self, steps=1):
+        # Enemy ke flow field er direction e player er dike move kore
+        st = self.cfg.state
+        enemies = st.enemies
+        n = len(enemies)
+        if not n:
+            return
 
-            if diff < min_diff:
-                min_diff = diff
-                closest = angle
+        # Steering prottek nav_every tick e ekbar, majhe dir_x/dir_y e rakha direction
+        # e chole; beshi enemy hole index er tukro kore prottek tick e ekta tukro.
+        # Bhir er table je tick e steer kore shei tick er position thekei banay,
+        # tai snapshot theke chalale o same result
+        every = self.cfg.nav_every
+        parts = max(1, min(every, n // STEER_SLICE))
+        phase = st.ticks % every
+        due = [p for p in range(parts) if (p - phase) % every < steps]
+        if due:
+            xs, ys = enemies.view("x"), enemies.view("y")
+            dir_x, dir_y = enemies.view("dir_x"), enemies.view("dir_y")
+            field = self.navigate()
+            keys = field.crowd(xs, ys, min(self.cfg.sep_weight, SEP_MAX))
+            txs, tys = self.targets()
+            reach = (field.cell * 1.5) ** 2
+            for p in due:
+                lo, hi = n * p // parts, n * (p + 1) // parts
+                dx, dy = field.steer(keys[lo:hi])
+                # Player er kacher cell gulote field mota, tai shoja shobcheye kacher
+                # player er dike jay
+                sx, sy = xs[lo:hi], ys[lo:hi]
+                ox, oy = txs[0] - sx, tys[0] - sy
+                d2 = ox * ox + oy * oy
+                for tx, ty in zip(txs[1:], tys[1:]):
+                    ax, ay = tx - sx, ty - sy
+                    a2 = ax * ax + ay * ay
+                    closer = a2 < d2
+                    ox, oy = np.where(closer, ax, ox), np.where(closer, ay, oy)
+                    d2 = np.minimum(a2, d2)
+                near = np.flatnonzero(d2 < reach)
+                if near.size:
+                    ox, oy = ox[near], oy[near]
+                    dist = np.hypot(ox, oy)
+                    safe = np.where(dist > 0, dist, 1.0)
+                    # Player er upor e thakle +x dike jay
+                    dx[near] = np.where(dist > 0, ox / safe, 1.0)
+                    dy[near] = oy / safe
+                dir_x[lo:hi], dir_y[lo:hi] = dx, dy
+        st.ticks += steps
+
+        # Enemy ke oi direction e move kore
+        enemies.move(self.cfg.e_spd * steps)
+
+    def flow_field(self):
+        # Arena er flow field, cell size bodlale notun kore banay
+        lo, hi = -self.cfg.arena, self.cfg.arena + 100
+        if self.field is None or not self.field.fits(self.cfg.nav_cell, lo, hi):
+            self.field = FlowField(self.cfg.nav_cell, lo, hi)
+        return self.field
+
+    def targets(self):
+        # Enemy ra kar dike jay (x gulo, y gulo): ekhane shudhu ei player,
+        # server er shared world eta bodle shob player dey
+        st = self.cfg.state
+        return (st.p_pos[0],), (st.p_pos[1],)
+
+    def navigate(self):
+        # Target der position er jonno field; keu na norle (and obstacle na
+        # bodlale) field o bodlay na
+        field = self.flow_field()
+        target = self.targets()
+        if field.target is None or target != self.nav_target:
+            field.update(*target)
+            self.nav_target = target
+        return field
+
+    def animate_enemies(self, steps=1):
+        # Enemy er size sine wave use kore animate kore
+        st = self.cfg.state
+        st.e_timer += 0.01 * steps
+        st.e_scale = 1.0 + 0.5 * math.sin(st.e_timer)
+
+    def auto_aim(self, steps=1):
+        # Auto aim enable thakle closest enemy er dike (lead dhore) ghure fire kore
+        st = self.cfg.state
+        enemies, cfg = st.enemies, self.cfg
+        expired = st.fire_cd > 0 and st.fire_cd <= steps
+        if st.fire_cd > 0:
+            st.fire_cd -= steps
+        if not len(enemies) or not st.auto_shoot:
+            return
 
-        # Closest enemy te rotate kore and aim thik thakle fire kore
-        if closest is not None:
-            self.cfg.p_rot = (self.cfg.p_rot + self.cfg.turn_spd/50) % 360
-            tolerance = 0.025 if self.cfg.fp else 0.05
-            if min_diff <= tolerance:
-                self.fire_weapon()
+        # Ager target ekhono ache kina (id diye, karon remove e index bodlay)
+        target = np.flatnonzero(enemies.view("ids") == st.aim_id)
+        # Fire er opekkhay ghurar shomoy o aim_cd tick por por abar dekhe, jate
+        # majhe spawn hoya kacher enemy bad na pore
+        waiting = st.fire_cd <= 0 and st.ticks % cfg.aim_cd < steps
+        # Shob candidate e bullet jacche (HOLD) hole shudhu oi somoy gulote abar dekhe
+        fresh = expired or waiting or (not target.size and st.aim_id != HOLD)
+        if not fresh and not target.size:
+            return
+        # Cooldown shesh hole ba target na thakle tobei puro index abar banay
+        target = self.retarget() if fresh else int(target[0])
+        if target is None:
+            return
+        gx, gy, _ = self.muzzle()
+        delta = self.aim_delta(target, gx, gy)
+        if delta > 180 and not fresh:
+            # Target heading er pichone chole gele puro ghurar bodole samner target ney
+            target = self.retarget()
+            if target is None:
+                return
+            delta = self.aim_delta(target, gx, gy)
+
+        # Ager moto ek dike ghure, target e pouche gele thame
+        turn = st.turn_spd / 50 * steps
+        st.p_rot = (st.p_rot + min(turn, delta)) % 360
+
+        # Aim thik thakle and cooldown shesh hole fire kore
+        tolerance = 0.025 if st.fp else 0.05
+        if abs(delta) <= turn + tolerance and st.fire_cd <= 0:
+            self.fire_weapon()
+            st.fire_cd = cfg.aim_cd
+            # Ei bullet target ke dhorbe, tai porer tick e notun target khoje oi dike ghure
+            st.aim_id = -1
+
+    def aim_delta(self, target, gx, gy):
+        # Shudhu ekta enemy er lead point er dike ghurte koto degree baki
+        st = self.cfg.state
+        enemies, cfg = st.enemies, self.cfg
+        x, y = float(enemies.x[target]), float(enemies.y[target])
+        vx, vy = self.chase_velocity(enemies.x[target:target + 1], enemies.y[target:target + 1])
+        lx, ly = lead_point(gx, gy, x, y, float(vx[0]), float(vy[0]), cfg.bullet_spd)
+        bearing = math.degrees(math.atan2(ly - gy, lx - gx)) % 360
+        return (bearing - (st.p_rot - 90) + 0.5) % 360 - 0.5
+
+    def chase_velocity(self, xs, ys):
+        # Enemy player ke dhorte je velocity te ashe (flow field dike e_spd),
+        # separation er dhakka bad diye, jate lead faka jaygay na pore
+        dx, dy = self.navigate().sample(xs, ys)
+        return dx * self.cfg.e_spd, dy * self.cfg.e_spd
+
+    def retarget(self):
+        # Shob enemy er lead point er bearing index kore samner prothom free enemy ber kore
+        # Shob candidate e age thekei bullet gele None (fire thamiye rakhe)
+        st = self.cfg.state
+        enemies = st.enemies
+        gx, gy, _ = self.muzzle()
+        ex, ey = enemies.view("x"), enemies.view("y")
+        vx, vy = self.chase_velocity(ex, ey)
+        self.targeter.update(gx, gy, ex, ey, vx, vy, self.cfg.bullet_spd)
+
+        # Je enemy er dike age thekei bullet jacche, take abar target kore na
+        # (shudhu samner koyekta candidate er jonno check kore)
+        bullets, spd = st.bullets, self.cfg.bullet_spd
+        bx, by = bullets.view("x"), bullets.view("y")
+        bvx, bvy = bullets.view("dir_x") * spd, bullets.view("dir_y") * spd
+
+        def skip(idx):
+            return claimed(bx, by, bvx, bvy, ex[idx], ey[idx], vx[idx], vy[idx],
+                           st.e_hitbox)
+
+        # Bullet p_rot - 90 degree dike jay, tai oi heading theke samne khoje
+        found = self.targeter.ahead(st.p_rot - 90, skip)
+        if found is None:
+            st.aim_id = HOLD
+            return None
+        st.aim_id = int(enemies.ids[found[0]])
+        return found[0]
 
 class GameController:
     def __init__(self):
@@ -397,8 +672,30 @@ class GameController:
         self.rend = GameRenderer(self.cfg)
         self.logic = GameLogic(self.cfg, self.rend)
 
+        # Fixed timestep er timing state
+        self.last_time = None   # Ager game_loop call er time
+        self.last_draw = 0.0    # Shesh frame kokhon draw hoyeche
+        self.lag = 0.0          # Ekhono simulate kora hoyni emon time
+        self.alpha = 1.0        # Duita tick er majhe render er position
+        self.tick_count = 0     # Ekhon porjonto koyta logic tick cholche
+        self.log = None         # Input recorder (replay.InputLog), na thakle None
+
+        # Profiler er overlay and export
+        self.prof = self.logic.prof
+        self.prof_path = "profile.csv"  # 'o' chaple kothay dump hobe
+        self.prof_lines = []    # Overlay er cached line
+        self.prof_shown = 0.0   # Overlay shesh kokhon update hoyeche
+
+    def start_game(self):
+        # Prothom enemy wave spawn kore and difficulty set kore
+        self.cfg.enemies.reserve(self.cfg.max_e)
+        self.logic.spawn_enemies(self.cfg.max_e)
+        self.cfg.e_spd += .10  # Enemy speed increase kore challenge er jonno
+
     def keyboard_handler(self, key, *args):
         # Keyboard input handle kore
+        if self.log is not None:
+            self.log.key(self.tick_count, key)
         x, y = self.cfg.p_pos[0], self.cfg.p_pos[1]
 
         if not self.cfg.over:
@@ -438,6 +735,8 @@ class GameController:
 
     def special_key_handler(self, key, *args):
         # Special keys (arrow keys) handle kore
+        if self.log is not None:
+            self.log.special(self.tick_count, key)
         if key == GLUT_KEY_UP:
             # Camera ke kache ane
             self.cfg.cam_elev -= 10
@@ -455,6 +754,8 @@ class GameController:
 
     def mouse_handler(self, button, state, x, y):
         # Mouse click handle kore
+        if self.log is not None:
+            self.log.mouse(self.tick_count, button, state)
         if button == GLUT_LEFT_BUTTON and state == GLUT_DOWN and not self.cfg.over:
             # Left click weapon fire kore
             self.logic.fire_weapon()
@@ -466,65 +767,150 @@ class GameController:
             self.cfg.turn_spd = 2.5 if self.cfg.fp else 5
 
     def reset_game(self):
-        # Game ke initial state e reset kore
-        self.cfg.__init__()
+        # Game ke initial state e reset kore, purono mesh free kore
+        self.rend.meshes.release()
+        self.cfg.state.reset()
         self.logic.spawn_enemies(self.cfg.max_e)
 
     def render_scene(self):
         # Game scene render kore
+        self.rend.hud.build(self.cfg.scr_w, self.cfg.scr_h)  # Prothom frame e glyph atlas banay
+        prof = self.prof
+        prof.begin()
+        self.draw_world()
+
+        if not self.cfg.over:
+            # Game stats display kore
+            lines = [(10, 770, f"Player Life: {self.cfg.hp}"),
+                     (10, 740, f"Score: {self.cfg.score}"),
+                     (10, 710, f"Misses: {self.cfg.misses}")]
+        else:
+            # Game over message display kore
+            lines = [(10, 770, f"Game Over! Score: {self.cfg.score}"),
+                     (10, 740, 'Press "R" to restart')]
+        self.rend.draw_hud(lines + self.profile_overlay())
+        prof.lap("hud")
+
+        prof.count("enemies", len(self.cfg.enemies))
+        prof.count("bullets", len(self.cfg.bullets))
+        prof.count("draw_calls", self.rend.stats["draw_calls"])
+        glutSwapBuffers()
+        prof.end_frame()
+
+    def draw_world(self):
+        # HUD chara 3D scene draw kore (GLUT lage na, offscreen eo chole)
+        prof = self.prof
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
         glViewport(0, 0, self.cfg.scr_w, self.cfg.scr_h)
+        self.rend.stats["draw_calls"] = 0
 
         # Camera view set kore
         self.rend.setup_view()
+        prof.lap("setup_view")
         # Game elements draw kore
         self.rend.draw_arena()
+        prof.lap("draw_arena")
         self.rend.draw_player()
+        for x, y, rot in self.rend.others:
+            self.rend.draw_player((x, y, 0), rot, False)
+        prof.lap("draw_player")
 
         if not self.cfg.over:
-            # Auto aim handle kore if enabled
-            if self.cfg.auto_shoot:
-                self.logic.auto_aim()
-
-            # Enemy draw kore
-            for enemy in self.cfg.enemies:
-                self.rend.draw_enemy(*enemy)
+            # Enemy draw kore ager and ekhon er tick er majhe
+            self.rend.draw_enemies(*self.cfg.enemies.lerp(self.alpha))
+            prof.lap("draw_enemies")
 
             # Bullet draw kore
-            for bullet in self.cfg.bullets:
-                self.rend.draw_projectile(*bullet[:3])
+            self.rend.draw_projectiles(*self.cfg.bullets.lerp(self.alpha))
+            prof.lap("draw_projectiles")
+
+    def profile_overlay(self):
+        # Profiler on thakle adha second por por p50/p99 line update kore
+        if not self.prof.enabled:
+            return []
+        now = time.perf_counter()
+        if now - self.prof_shown >= 0.5:
+            self.prof_lines = self.prof.overlay()
+            self.prof_shown = now
+        return self.prof_lines
 
-            # Game stats display kore
-            self.rend.show_text(10, 770, f"Player Life: {self.cfg.hp}")
-            self.rend.show_text(10, 740, f"Score: {self.cfg.score}")
-            self.rend.show_text(10, 710, f"Misses: {self.cfg.misses}")
+    def game_loop(self):
+        # Fixed rate e logic chalay, frame rate er upor depend kore na
+        now = time.perf_counter()
+        if self.last_time is None:
+            self.last_time = now
+        # Onek deri hole shob catch up na kore max_lag porjonto kore
+        self.lag += min(now - self.last_time, self.cfg.max_lag)
+        self.last_time = now
+
+        dt = 1.0 / self.cfg.sim_hz
+        while self.lag >= dt:
+            if not self.cfg.over:
+                self.logic.tick()
+                self.tick_count += 1
+            self.lag -= dt
+        self.alpha = self.lag / dt
+
+        # Frame cap er age draw na kore porer tick/frame porjonto ghumay
+        next_draw = self.last_draw + 1.0 / self.cfg.fps_cap
+        if now >= next_draw:
+            self.last_draw = now
+            glutPostRedisplay()
         else:
-            # Game over message display kore
-            self.rend.show_text(10, 770, f"Game Over! Score: {self.cfg.score}")
-            self.rend.show_text(10, 740, 'Press "R" to restart')
+            wait = min(next_draw - now, dt - self.lag)
+            if wait > 0:
+                time.sleep(wait)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="3D Shooter Game")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="profile every frame and dump to PATH (.csv/.json) on exit")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the RNG seed and all input to PATH for replay.py")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    # Window create kore and GLUT callback gulo set kore
+    glutInit()
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
+    glutInitWindowSize(1000, 800)
+    glutCreateWindow(b"3D Shooter Game")
+    glEnable(GL_DEPTH_TEST)
+    game = GameController()
+    if args.record:
+        # Seed and input log kore, game bondho hole file e likhe
+        from replay import InputLog
+        seed = args.seed if args.seed is not None else random.randrange(2 ** 63)
+        game.log = InputLog(seed)
+        atexit.register(game.log.save, args.record, game)
+        args.seed = seed
+    if args.seed is not None:
+        random.seed(args.seed)
+    game.start_game()
+    if args.profile:
+        # Profiler chalu rekhe game bondho hole file e dump kore
+        game.prof_path = args.profile
+        game.prof.enable()
+        atexit.register(game.prof.dump, args.profile)
+
+    def keyboard_handler(key, *args):
+        # Profiler er key shudhu ei window er, tai replay/server er input path e jay na
+        if key == b'p':
+            # Profiler and tar overlay on/off kore
+            game.prof.enable(not game.prof.enabled)
+        elif key == b'o':
+            # Profiler er data file e dump kore
+            game.prof.dump(game.prof_path)
+        else:
+            game.keyboard_handler(key, *args)
 
-        glutSwapBuffers()
+    glutDisplayFunc(game.render_scene)
+    glutIdleFunc(game.game_loop)
+    glutKeyboardFunc(keyboard_handler)
+    glutSpecialFunc(game.special_key_handler)
+    glutMouseFunc(game.mouse_handler)
+    glutMainLoop()
 
-    def game_loop(self):
-        if not self.cfg.over:
-            self.logic.update_enemies()
-            self.logic.animate_enemies()
-            self.logic.update_projectiles()
-            self.logic.check_collisions()
-        glutPostRedisplay()
-
-glutInit()
-glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
-glutInitWindowSize(1000, 800)
-glutCreateWindow(b"3D Shooter Game")
-glEnable(GL_DEPTH_TEST)
-game = GameController()
-game.logic.spawn_enemies(game.cfg.max_e)
-glutDisplayFunc(game.render_scene)
-glutIdleFunc(game.game_loop)
-glutKeyboardFunc(game.keyboard_handler)
-glutSpecialFunc(game.special_key_handler)
-glutMouseFunc(game.mouse_handler)
-game.cfg.e_spd += .10  # Enemy speed increase kore challenge er jonno
-glutMainLoop()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
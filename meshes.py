@@ -0,0 +1,224 @@
+import ctypes
+
+import numpy as np
+
+try:
+    from OpenGL.GL import *
+    from OpenGL.GL.shaders import compileShader
+    from OpenGL.GLU import *
+except ImportError:
+    # Headless mode e mesh lage na, shudhu class ta import hoy
+    pass
+
+# Prottek mesh er shape and size: (kind, radius gulo..., height)
+MESHES = {
+    "leg": ("cylinder", 5, 10, 50),
+    "arm": ("cylinder", 4, 8, 50),
+    "weapon": ("cylinder", 1, 10, 80),
+    "head": ("sphere", 20),
+    "body": ("cube", 40),
+}
+
+
+class MeshCache:
+    def __init__(self, detail=10):
+        self.detail = detail  # Sphere/cylinder er slices and stacks
+        self.quad = None      # Shob mesh er jonno ekta e quadric
+        self.lists = {}       # Mesh er naam theke display list
+
+    def build(self):
+        # Shob mesh ekbar tessellate kore display list e rakhe
+        if self.quad is None:
+            self.quad = gluNewQuadric()
+        for name, shape in MESHES.items():
+            if name in self.lists:
+                continue
+            self.lists[name] = glGenLists(1)
+            glNewList(self.lists[name], GL_COMPILE)
+            if shape[0] == "sphere":
+                gluSphere(self.quad, shape[1], self.detail, self.detail)
+            elif shape[0] == "cube":
+                # GLUT chara cube, jate offscreen eo draw kora jay
+                glBegin(GL_TRIANGLES)
+                for v in cube_tris(shape[1]).tolist():
+                    glVertex3f(*v)
+                glEnd()
+            else:
+                gluCylinder(self.quad, *shape[1:], self.detail, self.detail)
+            glEndList()
+
+    def draw(self, name):
+        # Cached mesh draw kore, na thakle age build kore
+        if name not in self.lists:
+            self.build()
+        glCallList(self.lists[name])
+
+    def release(self):
+        # Display list and quadric free kore
+        for lst in self.lists.values():
+            glDeleteLists(lst, 1)
+        self.lists = {}
+        if self.quad is not None:
+            gluDeleteQuadric(self.quad)
+            self.quad = None
+
+
+def sphere_tris(radius, slices=10, stacks=10):
+    # gluSphere er moto slices x stacks grid theke triangle list banay
+    phi = np.linspace(0, np.pi, stacks + 1)[:, None]
+    theta = np.linspace(0, 2 * np.pi, slices + 1)[None, :]
+    grid = np.stack([radius * np.sin(phi) * np.sin(theta),
+                     radius * np.sin(phi) * np.cos(theta),
+                     radius * np.cos(phi) * np.ones_like(theta)], axis=-1)
+    a, b = grid[:-1, :-1], grid[1:, :-1]
+    c, d = grid[1:, 1:], grid[:-1, 1:]
+    # Prottek quad ke duita triangle e bhag kore
+    return np.stack([a, b, c, a, c, d], axis=2).reshape(-1, 3)
+
+
+def cube_tris(size):
+    # glutSolidCube er moto center e ekta cube er 12 ta triangle
+    h = size / 2.0
+    corners = np.array([[x, y, z] for x in (-h, h) for y in (-h, h)
+                        for z in (-h, h)])
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+             (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    idx = [i for a, b, c, d in faces for i in (a, b, c, a, c, d)]
+    return corners[idx]
+
+
+def enemy_template(detail=10):
+    # Enemy er body (red) and head (black) ek shathe, body er center origin e
+    body = sphere_tris(35, detail, detail)
+    head = sphere_tris(15, detail, detail) + [0, 0, 50]
+    colors = np.concatenate([np.tile([1.0, 0, 0], (len(body), 1)),
+                             np.zeros((len(head), 3))])
+    return np.concatenate([body, head]), colors
+
+
+def bullet_template(size):
+    # Bullet ekta red cube
+    verts = cube_tris(size)
+    return verts, np.tile([1.0, 0, 0], (len(verts), 1))
+
+
+VERT_SRC = """
+#version 120
+attribute vec3 pos;
+attribute vec3 color;
+attribute vec4 inst;
+varying vec3 v_color;
+void main() {
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(inst.xyz + pos * inst.w, 1.0);
+    v_color = color;
+}
+"""
+
+FRAG_SRC = """
+#version 120
+varying vec3 v_color;
+void main() {
+    gl_FragColor = vec4(v_color, 1.0);
+}
+"""
+
+
+class BatchRenderer:
+    # Ek type er shob entity ke ek draw call e draw kore
+    def __init__(self, verts, colors):
+        self.verts = np.ascontiguousarray(verts, dtype=np.float32)
+        self.colors = np.ascontiguousarray(colors, dtype=np.float32)
+        self.mode = None       # "instanced" or "array", prothom draw e thik hoy
+        self.prog = None
+        self.vbos = None
+        self.inst = np.zeros((0, 4), dtype=np.float32)
+
+    def setup(self):
+        # Instancing support thakle shader + VBO, na thakle vertex array fallback
+        try:
+            if not bool(glDrawArraysInstanced) or not bool(glVertexAttribDivisor):
+                raise RuntimeError("instancing not supported")
+            prog = glCreateProgram()
+            glAttachShader(prog, compileShader(VERT_SRC, GL_VERTEX_SHADER))
+            glAttachShader(prog, compileShader(FRAG_SRC, GL_FRAGMENT_SHADER))
+            glBindAttribLocation(prog, 0, "pos")
+            glLinkProgram(prog)
+            if not glGetProgramiv(prog, GL_LINK_STATUS):
+                raise RuntimeError(glGetProgramInfoLog(prog))
+        except Exception:
+            self.mode = "array"
+            return
+        self.prog = prog
+        self.locs = [0, glGetAttribLocation(prog, "color"),
+                     glGetAttribLocation(prog, "inst")]
+        # Mesh er vertex and color ekbar e GPU te pathay
+        self.vbos = glGenBuffers(3)
+        for vbo, data in zip(self.vbos[:2], (self.verts, self.colors)):
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.mode = "instanced"
+
+    def draw(self, xs, ys, zs, scale=1.0):
+        # Shob entity er position + scale ek buffer e rekhe ekbar draw kore
+        n = len(xs)
+        if not n:
+            return
+        if self.mode is None:
+            self.setup()
+        if len(self.inst) < n:
+            self.inst = np.zeros((max(n, 2 * len(self.inst)), 4), dtype=np.float32)
+        inst = self.inst[:n]
+        inst[:, 0], inst[:, 1], inst[:, 2], inst[:, 3] = xs, ys, zs, scale
+
+        if self.mode == "instanced":
+            self.draw_instanced(inst)
+        else:
+            self.draw_array(inst)
+
+    def draw_instanced(self, inst):
+        glUseProgram(self.prog)
+        # Mesh er vertex and color, prottek vertex e alada
+        for loc, vbo in zip(self.locs[:2], self.vbos[:2]):
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glEnableVertexAttribArray(loc)
+            glVertexAttribPointer(loc, 3, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(0))
+        # Entity er transform, prottek instance e ekbar
+        loc = self.locs[2]
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbos[2])
+        glBufferData(GL_ARRAY_BUFFER, inst.nbytes, inst, GL_STREAM_DRAW)
+        glEnableVertexAttribArray(loc)
+        glVertexAttribPointer(loc, 4, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(0))
+        glVertexAttribDivisor(loc, 1)
+
+        glDrawArraysInstanced(GL_TRIANGLES, 0, len(self.verts), len(inst))
+
+        # Fixed function draw er jonno state abar age er moto kore
+        glVertexAttribDivisor(loc, 0)
+        for loc in self.locs:
+            glDisableVertexAttribArray(loc)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    def draw_array(self, inst):
+        # CPU te shob vertex transform kore ekta vertex array e draw kore
+        n = len(inst)
+        verts = inst[:, None, :3] + self.verts[None] * inst[:, None, 3:]
+        colors = np.broadcast_to(self.colors, (n,) + self.colors.shape)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, np.ascontiguousarray(verts))
+        glColorPointer(3, GL_FLOAT, 0, np.ascontiguousarray(colors))
+        glDrawArrays(GL_TRIANGLES, 0, n * len(self.verts))
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def release(self):
+        # GPU buffer and shader free kore
+        if self.vbos is not None:
+            glDeleteBuffers(3, self.vbos)
+            self.vbos = None
+        if self.prog is not None:
+            glDeleteProgram(self.prog)
+            self.prog = None
+        self.mode = None
@@ -0,0 +1,139 @@
+import numpy as np
+
+# Relax er jonno neighbour offset: 8 ta pasher cell and 8 ta knight move,
+# jate distance field prae Euclidean hoy (shudhu 8 dike hole 45 degree e bhange)
+OFFSETS = [(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3)
+           if (dx, dy) != (0, 0) and max(abs(dx), abs(dy)) == 1
+           or {abs(dx), abs(dy)} == {1, 2}]
+
+
+class FlowField:
+    # Arena er grid e player porjonto distance and prottek cell er move direction
+    def __init__(self, cell, lo, hi):
+        self.cell = float(cell)
+        self.lo = float(lo)
+        self.cols = max(1, int(np.ceil((hi - lo) / cell)))
+        self.blocked = np.zeros((self.cols, self.cols), dtype=bool)  # [y, x], obstacle
+        self.dist = np.zeros((self.cols, self.cols))
+        self.dir_x = np.zeros((self.cols, self.cols))
+        self.dir_y = np.zeros((self.cols, self.cols))
+        self.open = np.ones((self.cols, self.cols))  # 3x3 e deyal nei (1) na ache (0)
+        self.steer_x = self.dir_x  # Field + bhir er dhakka, crowd() e banano
+        self.steer_y = self.dir_y
+        self.target = None  # Kon cell (gulo) er jonno field banano ache
+
+    def fits(self, cell, lo, hi):
+        return (self.cell == cell and self.lo == lo and
+                self.cols == max(1, int(np.ceil((hi - lo) / cell))))
+
+    def cell_of(self, xs, ys):
+        # int e cast kore tarpor clip (float floor divide er cheye onek druto);
+        # arena er baire negative dik e truncate holeo clip e 0 hoy
+        top = self.cols - 1
+        cx = ((np.asarray(xs) - self.lo) / self.cell).astype(np.int64)
+        cy = ((np.asarray(ys) - self.lo) / self.cell).astype(np.int64)
+        return np.minimum(np.maximum(cx, 0), top), np.minimum(np.maximum(cy, 0), top)
+
+    def block(self, x0, y0, x1, y1):
+        # Ekta rectangle obstacle hishebe mark kore, porer update e field abar banay
+        cx0, cy0 = self.cell_of(x0, y0)
+        cx1, cy1 = self.cell_of(x1, y1)
+        self.blocked[cy0:cy1 + 1, cx0:cx1 + 1] = True
+        self.target = None
+
+    def update(self, px, py):
+        # Player (ba onek player, tokhon shobcheye kacher jon) notun cell e gele
+        # tobei field abar calculate kore
+        cx, cy = self.cell_of(np.atleast_1d(px), np.atleast_1d(py))
+        target = tuple(sorted(set(zip(cx.tolist(), cy.tolist()))))
+        if target == self.target:
+            return False
+        self.target = target
+
+        # Wavefront: shob offset diye bar bar relax kore jotokkhon na distance thame
+        n = self.cols
+        dist = np.full((n + 4, n + 4), np.inf)  # 2 cell er inf border
+        inner = dist[2:-2, 2:-2]
+        inner[cy, cx] = 0.0
+        free = ~self.blocked
+        while True:
+            best = inner.copy()
+            for dx, dy in OFFSETS:
+                np.minimum(best, dist[2 + dy:n + 2 + dy, 2 + dx:n + 2 + dx]
+                           + np.hypot(dx, dy), out=best)
+            best[~free] = np.inf
+            if np.array_equal(best, inner):
+                break
+            inner[:] = best
+        self.dist = inner * self.cell
+
+        # Jaoa jay na emon cell (obstacle ba bondho) ke shobar upore dhore,
+        # jate bhule oikhane dhuke pora enemy o bar hoye ashe
+        finite = np.isfinite(inner)
+        top = inner[finite].max() + 10 if finite.any() else 10.0
+        level = np.full((n + 4, n + 4), top + 10)
+        level[2:-2, 2:-2] = np.where(finite, inner, top)
+
+        # Prottek cell theke je neighbour e distance shobcheye druto kome shei dike
+        # (per unit length), deyal er pashe eo kokhono atke jay na
+        best = np.zeros((n, n))
+        self.dir_x, self.dir_y = np.zeros((n, n)), np.zeros((n, n))
+        for dx, dy in OFFSETS:
+            step = np.hypot(dx, dy)
+            drop = (level[2:-2, 2:-2] - level[2 + dy:n + 2 + dy, 2 + dx:n + 2 + dx]) / step
+            better = drop > best
+            best[better] = drop[better]
+            self.dir_x[better], self.dir_y[better] = dx / step, dy / step
+
+        # Khola jaygay (3x3 e kono deyal nei) gradient beshi smooth, 16 dike bhange na
+        gy, gx = np.gradient(level)
+        gx, gy = gx[2:-2, 2:-2], gy[2:-2, 2:-2]
+        norm = np.hypot(gx, gy)
+        wall = level >= top
+        near_wall = np.zeros((n, n), dtype=bool)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                near_wall |= wall[2 + dy:n + 2 + dy, 2 + dx:n + 2 + dx]
+        open_ = ~near_wall & (norm > 0)
+        self.dir_x[open_] = -gx[open_] / norm[open_]
+        self.dir_y[open_] = -gy[open_] / norm[open_]
+        self.open = (~near_wall).astype(float)
+        self.steer_x, self.steer_y = self.dir_x, self.dir_y
+        return True
+
+    def sample(self, xs, ys):
+        # Prottek enemy er cell theke direction table lookup
+        cx, cy = self.cell_of(xs, ys)
+        return self.dir_x[cy, cx], self.dir_y[cy, cx]
+
+    def crowd(self, xs, ys, weight):
+        # Prottek cell e koyta enemy ache ta gune bhir theke dure sorar dhakka banay,
+        # field er direction er shathe jog kore steer_x/steer_y table e rakhe;
+        # prottek enemy er flat cell index return kore, jate steer() abar na gune
+        cx, cy = self.cell_of(xs, ys)
+        n = self.cols
+        keys = cy * n + cx
+        if weight <= 0 or n < 2:
+            self.steer_x, self.steer_y = self.dir_x, self.dir_y
+            return keys
+        counts = np.bincount(keys, minlength=n * n).reshape(n, n)
+        # Dui pasher cell er enemy shongkhar parthokko (arena er kinare 0)
+        gx, gy = np.zeros((n, n)), np.zeros((n, n))
+        np.subtract(counts[:, 2:], counts[:, :-2], out=gx[:, 1:-1])
+        np.subtract(counts[2:], counts[:-2], out=gy[1:-1])
+        # Dhakka normalize kore (length shorbochcho weight), weight < 1 hole
+        # field er unit direction er cheye durbol, tai ghono bhir eo player er dike jay;
+        # deyal er pashe field e atke na jay, tai shekhane shudhu field (open = 0)
+        # (hypot er cheye square kore sqrt onek druto)
+        scale = np.sqrt(np.maximum(gx * gx + gy * gy, 1.0))
+        np.divide(self.open * weight, scale, out=scale)
+        sx = self.dir_x - gx * scale
+        sy = self.dir_y - gy * scale
+        # Jog kora vector er length 1 er beshi na, tai enemy e_spd er cheye druto na
+        norm = np.sqrt(np.maximum(sx * sx + sy * sy, 1.0))
+        self.steer_x, self.steer_y = sx / norm, sy / norm
+        return keys
+
+    def steer(self, keys):
+        # crowd() er cell index theke field + dhakka direction lookup
+        return self.steer_x.ravel()[keys], self.steer_y.ravel()[keys]
@@ -0,0 +1,152 @@
+import struct
+import zlib
+
+import numpy as np
+
+# Protita message: length, type, tarpor payload
+FRAME = struct.Struct("<IB")
+INPUT, ACK, SNAP = range(1, 4)
+
+EVENT = struct.Struct("<IBH")        # seq, kind, code (replay.EVENT er moto)
+SEQ = struct.Struct("<I")            # ack kora snapshot er seq
+SNAP_HEAD = struct.Struct("<II")     # snapshot er seq, kon seq er upor delta (0 = full)
+# Render er jonno je scalar gulo lage: player pos/rot, hp, score, misses,
+# enemy scale, camera, and fp/auto_shoot/auto_aim/over
+VIEW = struct.Struct("<3ffiiiffff4?")
+COUNTS = struct.Struct("<III")       # removed, new, changed
+
+SCALE = 8       # Position 1/8 unit e quantize hoy
+HISTORY = 64    # Koto purono snapshot porjonto delta er base hote pare
+STORES = ("bullets", "enemies")
+FRAMES = len(STORES) + 1  # Store gulo, tarpor onno player der (x, y, rot)
+
+
+def pack(kind, payload=b""):
+    return FRAME.pack(len(payload), kind) + payload
+
+
+async def read_message(reader):
+    # Ekta puro message pore (type, payload) dey
+    size, kind = FRAME.unpack(await reader.readexactly(FRAME.size))
+    return kind, await reader.readexactly(size)
+
+
+def view_of(state):
+    # Render er jonno GameState er scalar gulo
+    return (*state.p_pos, state.p_rot, state.hp, state.score, state.misses,
+            state.e_scale, state.cam_rot, state.cam_dist, state.cam_elev,
+            state.fp, state.auto_shoot, state.auto_aim, state.over)
+
+
+def empty():
+    return np.zeros(0, np.uint32), np.zeros((0, 3), np.int32)
+
+
+def frame(ids, *cols):
+    # Entity er id and tin ta column (quantized), id onujayi sorted
+    ids = np.asarray(ids).astype(np.uint32)
+    q = np.rint(np.column_stack(cols) * SCALE).astype(np.int32).reshape(-1, 3)
+    order = np.argsort(ids, kind="stable")
+    return ids[order], q[order]
+
+
+def capture(state, players=None):
+    # GameState theke render er view and prottek store er (sorted ids, quantized xyz);
+    # players (ids, x, y, rot) dile shesh frame e onno player ra
+    frames = []
+    for name in STORES:
+        store = getattr(state, name)
+        frames.append(frame(store.view("ids"), store.view("x"), store.view("y"),
+                            store.view("z")))
+    frames.append(frame(*players) if players is not None else empty())
+    return view_of(state), frames
+
+
+def diff(frame, base):
+    # base theke frame e jete: kon id gelo, kon id notun, kon id koto nodlo
+    ids, q = frame
+    b_ids, b_q = base
+    pos = np.minimum(np.searchsorted(b_ids, ids), max(len(b_ids) - 1, 0))
+    found = (b_ids[pos] == ids) if len(b_ids) else np.zeros(len(ids), dtype=bool)
+    removed = b_ids[~np.isin(b_ids, ids, assume_unique=True)]
+
+    d = q[found] - b_q[pos[found]]
+    moved = d.any(axis=1)
+    # int16 e na dhorle notun entity er moto puro position pathay
+    small = (np.abs(d) < 2 ** 15).all(axis=1)
+    new = ~found
+    new[np.flatnonzero(found)[moved & ~small]] = True
+    changed = moved & small
+    return (removed, ids[new], q[new],
+            ids[found][changed], d[changed].astype(np.int16))
+
+
+def encode(seq, base_seq, view, frames, bases=None):
+    # Snapshot ke (bases thakle tar upor delta kore) compressed bytes banay
+    parts = [VIEW.pack(*view)]
+    for i, frame in enumerate(frames):
+        base = empty() if bases is None else bases[i]
+        removed, new_ids, new_q, ch_ids, ch_d = diff(frame, base)
+        parts += [COUNTS.pack(len(removed), len(new_ids), len(ch_ids)),
+                  removed.tobytes(), new_ids.tobytes(), new_q.tobytes(),
+                  ch_ids.tobytes(), ch_d.tobytes()]
+    return SNAP_HEAD.pack(seq, base_seq) + zlib.compress(b"".join(parts), 1)
+
+
+def decode(payload, history):
+    # SNAP payload ke history[base] er upor boshiye (seq, view, frames) dey
+    seq, base_seq = SNAP_HEAD.unpack_from(payload)
+    buf = zlib.decompress(memoryview(payload)[SNAP_HEAD.size:])
+    view = VIEW.unpack_from(buf)
+    off = VIEW.size
+    frames = []
+    for i in range(FRAMES):
+        b_ids, b_q = history[base_seq][i] if base_seq else empty()
+        n_rem, n_new, n_ch = COUNTS.unpack_from(buf, off)
+        off += COUNTS.size
+
+        def take(dtype, count, cols=1):
+            nonlocal off
+            arr = np.frombuffer(buf, dtype=dtype, count=count * cols, offset=off)
+            off += arr.nbytes
+            return arr.reshape(-1, cols) if cols > 1 else arr
+
+        removed = take(np.uint32, n_rem)
+        new_ids, new_q = take(np.uint32, n_new), take(np.int32, n_new, 3)
+        ch_ids, ch_d = take(np.uint32, n_ch), take(np.int16, n_ch, 3)
+
+        # Base theke removed and puro position e asha id bad dey, change jog kore
+        keep = ~np.isin(b_ids, removed) & ~np.isin(b_ids, new_ids)
+        ids, q = b_ids[keep], b_q[keep].copy()
+        q[np.searchsorted(ids, ch_ids)] += ch_d
+        ids = np.concatenate([ids, new_ids])
+        q = np.concatenate([q, new_q])
+        order = np.argsort(ids, kind="stable")
+        frames.append((ids[order], q[order]))
+    return seq, view, frames
+
+
+def apply(state, view, frames):
+    # Decode kora snapshot GameState e boshay, ager position prev e rakhe (lerp er jonno);
+    # onno player der (x, y, rot) row return kore
+    (x, y, z, state.p_rot, state.hp, state.score, state.misses, state.e_scale,
+     state.cam_rot, state.cam_dist, state.cam_elev,
+     state.fp, state.auto_shoot, state.auto_aim, state.over) = view
+    state.p_pos = [x, y, z]
+    for name, (ids, q) in zip(STORES, frames):
+        store = getattr(state, name)
+        old_ids, old_x, old_y = (store.view("ids").copy(), store.view("x").copy(),
+                                 store.view("y").copy())
+        n = len(ids)
+        store.count = 0
+        store.reserve(n)
+        pos = q / SCALE
+        store.x[:n], store.y[:n], store.z[:n] = pos[:, 0], pos[:, 1], pos[:, 2]
+        store.ids[:n] = ids
+        # Ager snapshot e chilo emon entity er prev = ager position, notun gulor prev = ekhon
+        at = np.minimum(np.searchsorted(old_ids, ids), max(len(old_ids) - 1, 0))
+        seen = (old_ids[at] == ids) if len(old_ids) else np.zeros(n, dtype=bool)
+        store.prev_x[:n] = np.where(seen, old_x[at] if len(old_ids) else 0, pos[:, 0])
+        store.prev_y[:n] = np.where(seen, old_y[at] if len(old_ids) else 0, pos[:, 1])
+        store.count = n
+    return frames[len(STORES)][1] / SCALE
@@ -0,0 +1,109 @@
+import ctypes
+import os
+
+# OpenGL import er age EGL platform set korte hobe, tai ei module age import korte hoy
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+
+from OpenGL import EGL
+from OpenGL.GL import *
+
+
+def create_context(width, height):
+    # Window chara EGL pbuffer e OpenGL context banay (Mesa software rendering eo chole)
+    display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    if not EGL.eglInitialize(display, None, None):
+        raise RuntimeError("EGL display initialize kora jayni")
+
+    attrs = (EGL.EGLint * 13)(
+        EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+        EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+        EGL.EGL_DEPTH_SIZE, 24, EGL.EGL_NONE)
+    config = EGL.EGLConfig()
+    count = EGL.EGLint()
+    EGL.eglChooseConfig(display, attrs, ctypes.pointer(config), 1,
+                        ctypes.pointer(count))
+    if not count.value:
+        raise RuntimeError("EGL config pawa jayni")
+
+    size = (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height,
+                            EGL.EGL_NONE)
+    surface = EGL.eglCreatePbufferSurface(display, config, size)
+    # Game fixed function GL use kore, tai desktop OpenGL API bind kore
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+    if not EGL.eglMakeCurrent(display, surface, surface, context):
+        raise RuntimeError("EGL context current kora jayni")
+    glEnable(GL_DEPTH_TEST)
+    return display, surface, context
+
+
+class Framebuffer:
+    # Window er back buffer er bodole nijer color + depth renderbuffer e draw kore
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.fbo = glGenFramebuffers(1)
+        self.color, self.depth = glGenRenderbuffers(2)
+        glBindRenderbuffer(GL_RENDERBUFFER, self.color)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+        glBindRenderbuffer(GL_RENDERBUFFER, self.depth)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, width, height)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0,
+                                  GL_RENDERBUFFER, self.color)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT,
+                                  GL_RENDERBUFFER, self.depth)
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            raise RuntimeError("framebuffer complete hoyni")
+
+    def bind(self):
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glViewport(0, 0, self.width, self.height)
+
+    def release(self):
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glDeleteFramebuffers(1, [self.fbo])
+        glDeleteRenderbuffers(2, [self.color, self.depth])
+
+
+class PixelReader:
+    # Kayekta pixel buffer object er ring: ei frame er readback GPU te shuru kore,
+    # koyek frame ager ta map kore ney, jate glReadPixels render loop atkay na
+    def __init__(self, width, height, depth=3):
+        self.width, self.height = width, height
+        self.size = width * height * 4
+        self.free = list(glGenBuffers(depth))   # Ekhon kaje lagano jay emon PBO
+        self.pending = []                       # Readback cholche emon (pbo, tag)
+        for pbo in self.free:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+            glBufferData(GL_PIXEL_PACK_BUFFER, self.size, None, GL_STREAM_READ)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+    def full(self):
+        # Shob PBO busy hole notun readback er age finish() korte hobe
+        return not self.free
+
+    def start(self, tag=None):
+        # Bound framebuffer theke PBO te copy shuru kore (driver e async)
+        pbo = self.free.pop(0)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+        glReadPixels(0, 0, self.width, self.height, GL_RGBA, GL_UNSIGNED_BYTE,
+                     ctypes.c_void_p(0))
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self.pending.append((pbo, tag))
+
+    def finish(self):
+        # Shobcheye purono readback er pixel (bottom-up RGBA bytes) and tag dey
+        pbo, tag = self.pending.pop(0)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+        ptr = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+        data = ctypes.string_at(ptr, self.size)
+        glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self.free.append(pbo)
+        return data, tag
+
+    def release(self):
+        pbos = self.free + [pbo for pbo, _ in self.pending]
+        glDeleteBuffers(len(pbos), pbos)
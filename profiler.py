@@ -0,0 +1,101 @@
+import csv
+import json
+import time
+
+import numpy as np
+
+# Ring buffer er column: logic phase, render phase (seconds) and counter
+COLUMNS = ("update_enemies", "animate_enemies", "update_projectiles",
+           "check_collisions", "cull_projectiles", "auto_aim",
+           "setup_view", "draw_arena", "draw_player", "draw_enemies",
+           "draw_projectiles", "hud", "frame",
+           "enemies", "bullets", "draw_calls")
+COL = {name: i for i, name in enumerate(COLUMNS)}
+TIMES = COLUMNS[:COL["frame"] + 1]  # Je column gulo time
+
+
+def _noop(*args):
+    pass
+
+
+class FrameProfiler:
+    def __init__(self, size=1024, enabled=False):
+        self.buf = np.zeros((size, len(COLUMNS)))  # Proti frame er ekta row
+        self.row = np.zeros(len(COLUMNS))          # Ekhon er frame
+        self.head = 0          # Porer row kothay likhbe
+        self.filled = 0        # Koyta row e data ache
+        self.t = 0.0           # Shesh lap er time
+        self.last_end = None   # Ager frame kokhon shesh hoyeche
+        self.enable(enabled)
+
+    def enable(self, on=True):
+        # Off thakle shob method no-op, jate production e khoroch na hoy
+        self.enabled = on
+        if on:
+            for name in ("begin", "lap", "count", "end_frame"):
+                self.__dict__.pop(name, None)
+        else:
+            self.begin = self.lap = self.count = self.end_frame = _noop
+
+    def begin(self):
+        # Porer lap er shuru
+        self.t = time.perf_counter()
+
+    def lap(self, name):
+        # Ager lap theke ekhon porjonto time ei phase e jog kore
+        now = time.perf_counter()
+        self.row[COL[name]] += now - self.t
+        self.t = now
+
+    def count(self, name, value):
+        self.row[COL[name]] = value
+
+    def end_frame(self):
+        # Frame er row ring buffer e rakhe, purono row overwrite kore
+        now = time.perf_counter()
+        if self.last_end is not None:
+            self.row[COL["frame"]] = now - self.last_end
+        self.last_end = now
+        self.buf[self.head] = self.row
+        self.row[:] = 0
+        self.head = (self.head + 1) % len(self.buf)
+        self.filled = min(self.filled + 1, len(self.buf))
+
+    def rows(self):
+        # Purono theke notun order e shob row
+        if self.filled < len(self.buf):
+            return self.buf[:self.filled]
+        return np.roll(self.buf, -self.head, axis=0)
+
+    def summary(self):
+        # Prottek column er p50 and p99
+        rows = self.rows()
+        if not len(rows):
+            return {}
+        p50, p99 = np.percentile(rows, [50, 99], axis=0)
+        return {name: {"p50": float(p50[i]), "p99": float(p99[i])}
+                for i, name in enumerate(COLUMNS)}
+
+    def overlay(self, x=10, y=670, step=20):
+        # HUD e dekhanor jonno phase proti p50/p99 line (ms)
+        lines = []
+        for name, s in self.summary().items():
+            if name in TIMES:
+                text = f"{name}: {s['p50'] * 1e3:.2f} / {s['p99'] * 1e3:.2f} ms"
+            else:
+                text = f"{name}: {s['p50']:.0f} / {s['p99']:.0f}"
+            lines.append((x, y - step * len(lines), text))
+        return lines
+
+    def dump(self, path):
+        # Extension onujayi CSV or JSON e shob row likhe
+        rows = self.rows()
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"columns": COLUMNS, "rows": rows.tolist(),
+                           "summary": self.summary()}, f, indent=1)
+        else:
+            with open(path, "w", newline="") as f:
+                out = csv.writer(f)
+                out.writerow(COLUMNS)
+                out.writerows(rows.tolist())
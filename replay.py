@@ -0,0 +1,106 @@
+import argparse
+import random
+import struct
+import sys
+import time
+
+from intense import GameController
+
+MAGIC = b"SHRP"
+HEADER = struct.Struct("<4sBQ")     # magic, version, RNG seed
+EVENT = struct.Struct("<IBH")       # tick, kind, code
+RESULT = struct.Struct("<qii")      # final score, hp, misses
+VERSION = 5
+
+# Event er kind
+END, KEY, SPECIAL, MOUSE = range(4)
+
+
+class InputLog:
+    def __init__(self, seed):
+        self.seed = seed
+        self.data = bytearray()  # Shob event packed binary te
+
+    def __len__(self):
+        return len(self.data) // EVENT.size
+
+    def key(self, tick, key):
+        self.data += EVENT.pack(tick, KEY, key[0])
+
+    def special(self, tick, key):
+        self.data += EVENT.pack(tick, SPECIAL, key)
+
+    def mouse(self, tick, button, state):
+        # Mouse er x, y logic e lage na, tai shudhu button and state rakhe
+        self.data += EVENT.pack(tick, MOUSE, button << 8 | state)
+
+    def save(self, path, game):
+        # Header, event gulo and shesh e final tick + result likhe
+        cfg = game.cfg
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed))
+            f.write(self.data)
+            f.write(EVENT.pack(game.tick_count, END, 0))
+            f.write(RESULT.pack(cfg.score, cfg.hp, cfg.misses))
+
+
+def load(path):
+    # Recording file porre seed, event list and expected result dey
+    with open(path, "rb") as f:
+        buf = f.read()
+    magic, version, seed = HEADER.unpack_from(buf)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} recording")
+    events = []
+    for off in range(HEADER.size, len(buf) - RESULT.size, EVENT.size):
+        tick, kind, code = EVENT.unpack_from(buf, off)
+        events.append((tick, kind, code))
+    if not events or events[-1][1] != END:
+        raise ValueError(f"{path} is truncated")
+    return seed, events, RESULT.unpack_from(buf, len(buf) - RESULT.size)
+
+
+def replay(seed, events):
+    # Window chara, joto druto pare, recorded input abar game e dey
+    random.seed(seed)
+    game = GameController()
+    game.start_game()
+    for tick, kind, code in events:
+        # Event er tick porjonto logic chalay
+        while game.tick_count < tick and not game.cfg.over:
+            game.logic.tick()
+            game.tick_count += 1
+        if kind == KEY:
+            game.keyboard_handler(bytes([code]))
+        elif kind == SPECIAL:
+            game.special_key_handler(code)
+        elif kind == MOUSE:
+            game.mouse_handler(code >> 8, code & 0xFF, 0, 0)
+    return game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded session")
+    parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    seed, events, expected = load(args.path)
+    start = time.perf_counter()
+    game = replay(seed, events)
+    elapsed = time.perf_counter() - start
+
+    cfg = game.cfg
+    got = (cfg.score, cfg.hp, cfg.misses)
+    rate = game.tick_count / elapsed if elapsed > 0 else float("inf")
+    print(f"ticks: {game.tick_count}  events: {len(events) - 1}  "
+          f"time: {elapsed:.3f}s  ticks/sec: {rate:.0f}")
+    print(f"score/hp/misses: {got}  recorded: {expected}")
+    if got != tuple(expected):
+        print("MISMATCH")
+        return 1
+    print("match")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
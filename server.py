@@ -0,0 +1,311 @@
+import argparse
+import asyncio
+import random
+import struct
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+import net
+from intense import GameConfig, GameController
+from replay import KEY, MOUSE, SPECIAL
+
+MAX_BUFFER = 1 << 20    # Client er eto byte jome gele oi frame er snapshot bad dey
+MAX_INPUTS = 256        # Client er eto input jome gele purono gulo bad jay
+MAX_PLAYERS = 256       # Snapshot e bullet er id er niche player er slot thake
+GAME_KEYS = frozenset(b"wsadcvr")  # Client theke shudhu gameplay er key nay
+
+
+class World:
+    # Shob client er ekta shared game: enemy ekbar move kore shobcheye kacher player er
+    # dike, prottek player er nijer bullet, hp and score; RNG world er nijer, tai same
+    # seed e same game hoy and onno world ba global random er upor depend kore na
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.game = GameController()   # Enemy der state and logic (kono player na)
+        self.share(self.game.logic)
+        self.players = {}              # slot -> oi player er GameController
+        self.game.start_game()
+
+    def share(self, logic):
+        # Logic ke world er RNG, target and flow field dey
+        logic.rng = self.rng
+        logic.targets = self.targets
+        logic.field = self.game.logic.flow_field()
+
+    def targets(self):
+        # Khela cholche emon shob player er position; keu na thakle arena er majhe
+        live = [p.cfg.state.p_pos for p in self.players.values() if not p.cfg.state.over]
+        if not live:
+            return (0,), (0,)
+        return tuple(pos[0] for pos in live), tuple(pos[1] for pos in live)
+
+    def join(self):
+        # Notun player er slot and controller; enemy store world er ta
+        slot = next((s for s in range(MAX_PLAYERS) if s not in self.players), None)
+        if slot is None:
+            raise ValueError("server is full")
+        player = GameController()
+        player.cfg.state.enemies = self.game.cfg.state.enemies
+        player.cfg.e_spd = self.game.cfg.e_spd
+        self.share(player.logic)
+        self.players[slot] = player
+        return slot, player
+
+    def leave(self, slot):
+        # Player er bullet o tar shathe chole jay
+        self.players.pop(slot, None)
+
+    def reset(self, slot):
+        # 'r': shudhu ei player notun kore shuru kore, enemy gulo shobar tai thake
+        self.players[slot].cfg.state.reset(enemies=False)
+
+    def tick(self, steps=1):
+        # Shob player er jonno ekta world tick (GameLogic.tick er moto), koyta tick holo
+        # return kore; kono player khela na korle world theme thake
+        live = [p for p in self.players.values() if not p.cfg.state.over]
+        if not live:
+            return steps
+        if steps > 1 and any(p.cfg.state.auto_shoot for p in live):
+            # Auto shoot prottek tick e aim kore, tai stride e result na bodlay
+            for _ in range(steps):
+                self.tick()
+            return steps
+        world = self.game.cfg.state
+        self.game.logic.advance_enemies(steps)
+        for player in live:
+            st = player.cfg.state
+            st.ticks, st.e_timer, st.e_scale = world.ticks, world.e_timer, world.e_scale
+            player.logic.advance_player(steps)
+        return steps
+
+    def advance(self, ticks, stride):
+        # Swept collision er jonno stride ta tick ek pass e chalano jay
+        while ticks > 0:
+            ticks -= self.tick(min(stride, ticks))
+
+    def capture(self):
+        # Shob session er jonno ekbar: shob player er bullet (id er niche slot),
+        # enemy, and player der (x, y, rot)
+        slots = list(self.players)
+        states = [self.players[slot].cfg.state for slot in slots]
+        ids = [st.bullets.view("ids") * MAX_PLAYERS + slot for slot, st in zip(slots, states)]
+        cols = [[st.bullets.view(f) for st in states] for f in ("x", "y", "z")]
+        bullets = net.frame(np.concatenate([np.zeros(0, np.int64)] + ids),
+                            *(np.concatenate([np.zeros(0)] + col) for col in cols))
+        enemies = self.game.cfg.state.enemies
+        return [bullets,
+                net.frame(enemies.view("ids"), enemies.view("x"), enemies.view("y"),
+                          enemies.view("z")),
+                net.frame(slots, [st.p_pos[0] for st in states],
+                          [st.p_pos[1] for st in states],
+                          [st.p_rot % 360 for st in states])]
+
+
+class Session:
+    # Ekta client: shared world e tar player, input and snapshot er ack
+    def __init__(self, writer, world):
+        self.writer = writer
+        self.world = world
+        self.slot, self.player = world.join()
+        self.inputs = deque(maxlen=MAX_INPUTS)  # Porer frame e apply hobe emon input
+        self.history = {}         # seq -> frames, ack er jonno rakha
+        self.seq = 0
+        self.acked = 0            # Client shesh kon snapshot peyeche
+        self.sent = 0             # Ekhon porjonto koto byte pathano hoyeche
+
+    def apply_inputs(self):
+        player = self.player
+        while self.inputs:
+            kind, code = self.inputs.popleft()
+            if kind == KEY:
+                # Profiler er moto local key client chalate pare na
+                if code == ord("r"):
+                    self.world.reset(self.slot)
+                elif code in GAME_KEYS:
+                    player.keyboard_handler(bytes([code]))
+            elif kind == SPECIAL:
+                player.special_key_handler(code)
+            elif kind == MOUSE:
+                player.mouse_handler(code >> 8, code & 0xFF, 0, 0)
+
+    def snapshot(self, frames):
+        # World.capture er frame theke nijer player bad diye, client je snapshot
+        # ack koreche tar upor delta banay, na thakle full
+        self.seq += 1
+        ids, q = frames[-1]
+        others = ids != self.slot
+        frames = frames[:-1] + [(ids[others], q[others])]
+        view = net.view_of(self.player.cfg.state)
+        bases = self.history.get(self.acked)
+        data = net.encode(self.seq, self.acked if bases else 0, view, frames, bases)
+        self.history[self.seq] = frames
+        self.history.pop(self.seq - net.HISTORY, None)
+        return net.pack(net.SNAP, data)
+
+
+class Server:
+    def __init__(self, host="127.0.0.1", port=7777, net_hz=30, stride=1, seed=None):
+        self.host, self.port = host, port
+        self.net_hz = net_hz        # Proti second e koyta snapshot
+        self.stride = stride        # Ek logic pass e koyta tick
+        self.world = World(seed)    # Shob client er shared game
+        self.sessions = []
+        self.frame_times = deque(maxlen=512)  # World tick + shob session encode er shomoy
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def handle(self, reader, writer):
+        # Client er input and ack pore session e rakhe
+        try:
+            session = Session(writer, self.world)
+        except ValueError:
+            # Shob slot bhora
+            writer.close()
+            return
+        self.sessions.append(session)
+        try:
+            while True:
+                kind, payload = await net.read_message(reader)
+                if kind == net.INPUT:
+                    _, event, code = net.EVENT.unpack(payload)
+                    session.inputs.append((event, code))
+                elif kind == net.ACK:
+                    seq, = net.SEQ.unpack(payload)
+                    # Purono ba ekhono na pathano seq er ack bad dey
+                    if session.acked < seq <= session.seq:
+                        session.acked = seq
+        except (asyncio.IncompleteReadError, ConnectionError, struct.error):
+            # Connection bondho ba bhul payload hole client ke bad dey
+            pass
+        finally:
+            self.sessions.remove(session)
+            self.world.leave(session.slot)
+            writer.close()
+
+    async def run(self):
+        # Fixed rate e world er logic ekbar chalay and prottek session e snapshot pathay
+        sim_hz = GameConfig().sim_hz
+        period = 1.0 / self.net_hz
+        carry = 0.0
+        next_frame = time.perf_counter()
+        while True:
+            start = time.perf_counter()
+            carry += sim_hz * period
+            ticks, carry = int(carry), carry - int(carry)
+            sessions = list(self.sessions)
+            for session in sessions:
+                session.apply_inputs()
+            self.world.advance(ticks, self.stride)
+            frames = self.world.capture()
+            for session in sessions:
+                data = session.snapshot(frames)
+                if session.writer.transport.get_write_buffer_size() < MAX_BUFFER:
+                    session.writer.write(data)
+                    session.sent += len(data)
+            self.frame_times.append(time.perf_counter() - start)
+
+            next_frame += period
+            await asyncio.sleep(max(0.0, next_frame - time.perf_counter()))
+
+    def headroom(self):
+        # Frame budget er koto bhag faka: (p50, p99) frame time and p99 headroom
+        times = np.array(self.frame_times)
+        if not times.size:
+            return 0.0, 0.0, 1.0
+        p50, p99 = np.percentile(times, [50, 99])
+        return p50, p99, 1.0 - p99 * self.net_hz
+
+
+async def bot(host, port, seconds, stats):
+    # Simulated client: auto shoot chalu kore, majhe majhe ghore, prottek snapshot ack kore
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(net.pack(net.INPUT, net.EVENT.pack(0, KEY, ord("c"))))
+    history, received, seq = {}, 0, 0
+    end = time.perf_counter() + seconds
+    try:
+        while time.perf_counter() < end:
+            kind, payload = await asyncio.wait_for(net.read_message(reader), 1.0)
+            received += net.FRAME.size + len(payload)
+            if kind != net.SNAP:
+                continue
+            seq, view, frames = net.decode(payload, history)
+            history[seq] = frames
+            # Ack er age er base gulo ar lagbe na
+            for old in [s for s in history if s <= seq - net.HISTORY]:
+                del history[old]
+            writer.write(net.pack(net.ACK, net.SEQ.pack(seq)))
+            if random.random() < 0.05:
+                key = random.choice(b"adw")
+                writer.write(net.pack(net.INPUT, net.EVENT.pack(seq, KEY, key)))
+    finally:
+        writer.close()
+    stats.append((received, seq))
+
+
+async def load_test(counts, seconds, net_hz, stride, seed=None):
+    # Loopback e server chalu kore client shongkha bariye bandwidth and headroom mape
+    server = await Server("127.0.0.1", 0, net_hz, stride, seed).start()
+    runner = asyncio.ensure_future(server.run())
+    print(f"{'clients':>7} {'KB/s/client':>12} {'snaps/s':>8} "
+          f"{'frame p50':>10} {'frame p99':>10} {'headroom':>9}")
+    try:
+        for count in counts:
+            server.frame_times.clear()
+            stats = []
+            await asyncio.gather(*(bot("127.0.0.1", server.port, seconds, stats)
+                                   for _ in range(count)))
+            if runner.done():
+                runner.result()  # Server loop crash korle error ta dekhay
+            p50, p99, free = server.headroom()
+            kbps = np.mean([r for r, _ in stats]) / seconds / 1024
+            snaps = np.mean([s for _, s in stats]) / seconds
+            print(f"{count:7} {kbps:12.2f} {snaps:8.1f} {p50 * 1e3:8.2f}ms "
+                  f"{p99 * 1e3:8.2f}ms {free:9.0%}")
+            # Client disconnect hoye session gulo shore jak
+            await asyncio.sleep(0.1)
+    finally:
+        runner.cancel()
+        server.server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Authoritative game server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--net-hz", type=int, default=30, help="snapshots per second")
+    parser.add_argument("--stride", type=int, default=1,
+                        help="ticks simulated per logic pass (swept collisions keep hits)")
+    parser.add_argument("--bots", metavar="N,N,...",
+                        help="loopback load test with this many simulated clients per step")
+    parser.add_argument("--seconds", type=float, default=5.0,
+                        help="duration of each load test step")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the shared world")
+    args = parser.parse_args(argv)
+
+    if args.bots:
+        counts = [int(n) for n in args.bots.split(",")]
+        asyncio.run(load_test(counts, args.seconds, args.net_hz, args.stride, args.seed))
+        return 0
+
+    async def serve():
+        server = await Server(args.host, args.port, args.net_hz, args.stride,
+                              args.seed).start()
+        print(f"serving on {args.host}:{server.port} at {args.net_hz} Hz")
+        await server.run()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
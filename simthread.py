@@ -0,0 +1,216 @@
+import argparse
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from intense import GameController
+from replay import KEY, MOUSE, SPECIAL
+from state import GameState
+
+try:
+    from OpenGL.GLUT import *
+except ImportError:
+    pass
+
+STORES = ("bullets", "enemies")
+SCALARS = tuple(name for name in GameState.__slots__ if name not in STORES)
+FIELDS = ("x", "y", "z", "prev_x", "prev_y", "ids")  # Render e je field lage
+
+
+class Frame:
+    # Ek tick shesh howar porer world er read-only copy, render thread er jonno.
+    # Array gulo ekbar allocate hoy and prottek capture e overwrite hoy (double buffer)
+    __slots__ = ("values", "stores", "buffers", "time", "ticks")
+
+    def __init__(self):
+        self.time = 0.0
+        self.ticks = 0
+        self.values = ()
+        self.stores = {}
+        self.buffers = {name: {} for name in STORES}  # Store er capacity onujayi array
+
+    def capture(self, state, ticks):
+        # Sim er state ei frame er buffer e copy kore; store er capacity barle
+        # tobei buffer o bare, tai normal e kono notun array banay na
+        self.time = time.perf_counter()
+        self.ticks = ticks
+        self.values = tuple(list(v) if isinstance(v, list) else v
+                            for v in (getattr(state, name) for name in SCALARS))
+        for name in STORES:
+            store = getattr(state, name)
+            count, buffers, arrays = store.count, self.buffers[name], {}
+            for field in FIELDS:
+                src = store.view(field)
+                dst = buffers.get(field)
+                if dst is None or len(dst) < count:
+                    dst = buffers[field] = np.empty(store.capacity, dtype=src.dtype)
+                dst[:count] = src
+                arr = dst[:count]
+                arr.setflags(write=False)
+                arrays[field] = arr
+            self.stores[name] = (count, arrays)
+        return self
+
+    def install(self, state):
+        # Render side er GameState ke ei frame dekhay, array copy na kore
+        for name, value in zip(SCALARS, self.values):
+            setattr(state, name, list(value) if isinstance(value, list) else value)
+        for name, (count, arrays) in self.stores.items():
+            store = getattr(state, name)
+            for field, arr in arrays.items():
+                setattr(store, field, arr)
+            store.count = count
+
+
+class SimThread:
+    # Logic alada thread e fixed rate e chalay, render interval e ekbar Frame publish kore.
+    # Duita Frame: front render er jonno, onnota te sim porer copy likhe tarpor flip kore
+    def __init__(self, game, limit=None):
+        self.game = game
+        self.inputs = deque()   # GLUT thread theke asha (kind, code), tick er fanke apply hoy
+        self.frames = (Frame(), Frame())
+        self.front = self.frames[0].capture(game.cfg.state, 0)  # Render shudhu eta pore
+        self.reading = self.front  # Render thread shesh kon Frame dhoreche
+        self.limit = limit      # Bench: eto tick por thame, real time er opekkha na kore
+        self.running = False
+        self.thread = None
+        self.busy = 0.0         # Logic e mot koto shomoy gelo (measurement er jonno)
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+
+    def apply_inputs(self):
+        # Kono input apply hole True, tahole state bodlay and Frame lage
+        game = self.game
+        applied = bool(self.inputs)
+        while self.inputs:
+            kind, code = self.inputs.popleft()
+            if kind == KEY:
+                game.keyboard_handler(bytes([code]))
+            elif kind == SPECIAL:
+                game.special_key_handler(code)
+            elif kind == MOUSE:
+                game.mouse_handler(code >> 8, code & 0xFF, 0, 0)
+        return applied
+
+    def publish(self, ticks):
+        # Render ekhon er front ta dhorle tobei onno Frame ta faka, tai oita bhore flip
+        # kore; na dhorle back ta hoyto ekhono draw hocche, tai ei bar bad dey
+        if self.reading is not self.front:
+            return False
+        back = self.frames[self.front is self.frames[0]]
+        # Reference assignment atomic, tai render er lock lage na
+        self.front = back.capture(self.game.cfg.state, ticks)
+        return True
+
+    def run(self):
+        # game_loop er moto accumulator, kintu draw er bodole Frame publish kore
+        game, cfg = self.game, self.game.cfg
+        dt = 1.0 / cfg.sim_hz
+        frame_dt = 1.0 / cfg.fps_cap
+        last, lag = time.perf_counter(), 0.0
+        published, dirty = last, False
+        while self.running:
+            now = time.perf_counter()
+            lag = dt if self.limit is not None else lag + min(now - last, cfg.max_lag)
+            last = now
+            if lag >= dt:
+                start = time.perf_counter()
+                dirty |= self.apply_inputs()
+                while lag >= dt:
+                    if not cfg.over:
+                        game.logic.tick()
+                        game.tick_count += 1
+                        dirty = True
+                    lag -= dt
+                # Render fps_cap er beshi frame draw kore na, tai render interval e
+                # ekbar (and kichu bodlale tobei) copy kore
+                if dirty and start - published >= frame_dt and self.publish(game.tick_count):
+                    published, dirty = start, False
+                self.busy += time.perf_counter() - start
+            if self.limit is None:
+                time.sleep(max(0.0, dt - lag))
+            elif game.tick_count >= self.limit:
+                self.running = False
+
+
+class ThreadedGame:
+    # GLUT thread shudhu draw kore, logic SimThread e chole
+    def __init__(self, limit=None):
+        self.sim_game = GameController()   # Logic er authoritative state
+        self.screen = GameController()     # Render er jonno, state e Frame install hoy
+        self.sim = SimThread(self.sim_game, limit)
+        self.shown = None                  # Ekhon kon Frame draw hocche
+
+    def start_game(self):
+        self.sim_game.start_game()
+        self.sim.publish(0)
+        self.sim.start()
+
+    def keyboard_handler(self, key, *args):
+        self.sim.inputs.append((KEY, key[0]))
+
+    def special_key_handler(self, key, *args):
+        self.sim.inputs.append((SPECIAL, key))
+
+    def mouse_handler(self, button, state, x, y):
+        self.sim.inputs.append((MOUSE, button << 8 | state))
+
+    def sync(self):
+        # Sim er shesh Frame render state e boshay and interpolation alpha ber kore
+        frame = self.sim.front
+        # Sim ke janay ei Frame draw hobe, tai se shudhu onnota te likhbe
+        self.sim.reading = frame
+        if frame is not self.shown:
+            frame.install(self.screen.cfg.state)
+            self.shown = frame
+        dt = 1.0 / self.screen.cfg.sim_hz
+        self.screen.alpha = min(1.0, (time.perf_counter() - frame.time) / dt)
+
+    def idle(self):
+        screen = self.screen
+        now = time.perf_counter()
+        next_draw = screen.last_draw + 1.0 / screen.cfg.fps_cap
+        if now >= next_draw:
+            screen.last_draw = now
+            self.sync()
+            glutPostRedisplay()
+        else:
+            time.sleep(next_draw - now)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play with the logic on a worker thread")
+    parser.add_argument("--enemies", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    glutInit()
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
+    glutInitWindowSize(1000, 800)
+    glutCreateWindow(b"3D Shooter Game")
+    from OpenGL.GL import glEnable, GL_DEPTH_TEST
+    glEnable(GL_DEPTH_TEST)
+    game = ThreadedGame()
+    game.sim_game.cfg.max_e = args.enemies
+    game.start_game()
+    glutDisplayFunc(game.screen.render_scene)
+    glutIdleFunc(game.idle)
+    glutKeyboardFunc(game.keyboard_handler)
+    glutSpecialFunc(game.special_key_handler)
+    glutMouseFunc(game.mouse_handler)
+    glutMainLoop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import mmap
+import random
+import struct
+from array import array
+
+import numpy as np
+
+from entities import EntityStore
+
+# Snapshot er layout: scalar gulo, RNG state, tarpor bullet and enemy store
+SCALARS = struct.Struct("<4sB3dd3qdddddddqqq4?")
+MAGIC, VERSION = b"SHST", 4
+RNG = struct.Struct("<iid")          # RNG version, position, gauss_next
+RNG_WORDS = 624                       # Mersenne Twister er state
+STORE = struct.Struct("<qq")          # count, next_id
+
+
+class GameState:
+    # Game cholar shomoy je value gulo bodlay, tuning config theke alada
+    __slots__ = ("p_pos", "p_rot", "hp", "score", "misses",
+                 "e_scale", "e_timer", "e_hitbox", "turn_spd",
+                 "cam_rot", "cam_dist", "cam_elev", "fire_cd", "aim_id", "ticks",
+                 "fp", "auto_shoot", "auto_aim", "over",
+                 "bullets", "enemies")
+
+    def __init__(self):
+        self.bullets = EntityStore(256)  # Bullet er store
+        self.enemies = EntityStore(64)   # Enemy er store
+        self.reset()
+
+    def reset(self, enemies=True):
+        # Notun game er moto sob value set kore, store gulo reuse kore
+        # (server er shared world e ek player reset korle enemy gulo shobar, tai thake)
+        self.p_pos = [0, 0, 0]  # Player er position
+        self.p_rot = 0          # Player er rotation
+        self.hp = 5             # Player er health
+        self.score = 0          # Player er score
+        self.misses = 0         # Missed shot er count
+        self.e_scale = 1.0      # Enemy er size scale
+        self.e_timer = 0        # Enemy animation er timer
+        self.e_hitbox = 60      # Enemy er hitbox size (auto shoot e bodlay)
+        self.turn_spd = 5       # Player er turning speed (first person e bodlay)
+        self.cam_rot = 0        # Camera er rotation angle
+        self.cam_dist = 600     # Camera er distance from center
+        self.cam_elev = 600     # Camera er elevation (upor niche)
+        self.fire_cd = 0        # Auto aim abar fire korar age koto tick baki
+        self.aim_id = -1        # Auto aim kon enemy id er dike ghurche (-1 hole keu na, -2 hole fire thamano)
+        self.ticks = 0          # Game shuru theke koyta logic tick hoyeche
+        self.fp = False         # First person view on/off
+        self.auto_shoot = False # Auto shooting on/off
+        self.auto_aim = False   # Auto aiming on/off
+        self.over = False       # Game over status
+        self.bullets.clear()
+        if enemies:
+            self.enemies.clear()
+
+    def snapshot(self):
+        # Puro state (RNG shoho) ekta flat bytes buffer e pack kore
+        rng = random.getstate()
+        parts = [SCALARS.pack(MAGIC, VERSION, *self.p_pos, self.p_rot,
+                              self.hp, self.score, self.misses,
+                              self.e_scale, self.e_timer, self.e_hitbox,
+                              self.turn_spd, self.cam_rot, self.cam_dist,
+                              self.cam_elev, self.fire_cd, self.aim_id, self.ticks, self.fp,
+                              self.auto_shoot,
+                              self.auto_aim, self.over),
+                 RNG.pack(rng[0], rng[1][-1],
+                          float("nan") if rng[2] is None else rng[2]),
+                 array("I", rng[1][:-1]).tobytes()]
+        for store in (self.bullets, self.enemies):
+            n = store.count
+            parts.append(STORE.pack(n, store.next_id))
+            for name in store.FIELDS + ("ids",):
+                parts.append(getattr(store, name)[:n].tobytes())
+        return b"".join(parts)
+
+    def restore(self, buf):
+        # snapshot() er buffer (bytes, memoryview or mmap) theke state fire ane
+        buf = memoryview(buf)
+        vals = SCALARS.unpack_from(buf)
+        if vals[:2] != (MAGIC, VERSION):
+            raise ValueError("not a game state snapshot")
+        (x, y, z, self.p_rot, self.hp, self.score, self.misses,
+         self.e_scale, self.e_timer, self.e_hitbox, self.turn_spd,
+         self.cam_rot, self.cam_dist, self.cam_elev, self.fire_cd, self.aim_id, self.ticks,
+         self.fp, self.auto_shoot, self.auto_aim, self.over) = vals[2:]
+        self.p_pos = [x, y, z]
+        off = SCALARS.size
+
+        version, pos, gauss = RNG.unpack_from(buf, off)
+        off += RNG.size
+        words = np.frombuffer(buf, dtype=np.uint32, count=RNG_WORDS, offset=off)
+        off += RNG_WORDS * 4
+        random.setstate((version, tuple(words.tolist()) + (pos,),
+                         None if gauss != gauss else gauss))
+
+        for store in (self.bullets, self.enemies):
+            n, store.next_id = STORE.unpack_from(buf, off)
+            off += STORE.size
+            store.count = 0
+            store.reserve(n)
+            for name in store.FIELDS + ("ids",):
+                arr = getattr(store, name)
+                arr[:n] = np.frombuffer(buf, dtype=arr.dtype, count=n, offset=off)
+                off += n * arr.itemsize
+            store.count = n
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.snapshot())
+
+    def load(self, path):
+        # Disk er snapshot memory-map kore restore kore, puro file copy na kore
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.restore(mm)
@@ -0,0 +1,135 @@
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Ei parameter gulo sweep kora jay, shob float hishebe parse hoy
+PARAMS = ("e_spd", "max_e", "e_hitbox", "max_miss", "bullet_spd", "turn_spd")
+INTS = ("max_e", "max_miss")
+
+
+def run_game(params, seed, ticks, fp, stride):
+    # Ekta seeded headless game bot diye chalay and result dey
+    from headless import HeadlessEngine
+
+    engine = HeadlessEngine(seed=seed, enemies=params.get("max_e"),
+                            auto_shoot=True, auto_aim=fp, fp=fp)
+    cfg = engine.cfg
+    # start_game er pore set kore, jate e_spd sweep er value tai final speed hoy
+    for name, value in params.items():
+        if name != "max_e":
+            setattr(cfg, name, value)
+    engine.step(ticks, stride)
+    return {
+        "params": params,
+        "seed": seed,
+        "score": cfg.score,
+        "ticks": engine.ticks,
+        "misses": cfg.misses,
+        "hp": cfg.hp,
+        "survived": not cfg.over,
+    }
+
+
+def grid(specs):
+    # "name=a,b,c" gulo theke shob combination er dict banay
+    axes = []
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in PARAMS or not values:
+            raise ValueError(f"bad parameter {spec!r}, expected one of {', '.join(PARAMS)}")
+        cast = int if name in INTS else float
+        axes.append([(name, cast(v)) for v in values.split(",")])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+
+def aggregate(rows):
+    # Same parameter set er game gulo ekshathe kore statistics ber kore
+    groups = {}
+    for row in rows:
+        key = json.dumps(row["params"], sort_keys=True)
+        groups.setdefault(key, []).append(row)
+    stats = []
+    for key, games in groups.items():
+        scores = [g["score"] for g in games]
+        stats.append({
+            "params": json.loads(key),
+            "games": len(games),
+            "score_mean": statistics.fmean(scores),
+            "score_median": statistics.median(scores),
+            "score_stdev": statistics.pstdev(scores),
+            "ticks_mean": statistics.fmean(g["ticks"] for g in games),
+            "misses_mean": statistics.fmean(g["misses"] for g in games),
+            "survival_rate": sum(g["survived"] for g in games) / len(games),
+        })
+    return sorted(stats, key=lambda s: -s["score_mean"])
+
+
+def report(stats):
+    for s in stats:
+        params = " ".join(f"{k}={v}" for k, v in s["params"].items()) or "(defaults)"
+        print(f"{params:40} games {s['games']:5}  "
+              f"score {s['score_mean']:7.2f} ±{s['score_stdev']:6.2f} "
+              f"(median {s['score_median']:g})  ticks {s['ticks_mean']:8.0f}  "
+              f"misses {s['misses_mean']:5.2f}  survived {s['survival_rate']:.0%}")
+
+
+def load(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded bot games over a parameter grid")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2",
+                        help=f"values to sweep, repeatable ({', '.join(PARAMS)})")
+    parser.add_argument("--games", type=int, default=100, help="games per parameter set")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--ticks", type=int, default=20000, help="tick limit per game")
+    parser.add_argument("--stride", type=int, default=1,
+                        help="ticks simulated per logic pass")
+    parser.add_argument("--fp", action="store_true", help="first person bot (auto-aim)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="sweep.jsonl", help="per-game results (JSON lines)")
+    parser.add_argument("--aggregate", metavar="PATH",
+                        help="only summarise an existing results file")
+    args = parser.parse_args(argv)
+
+    if args.aggregate:
+        report(aggregate(load(args.aggregate)))
+        return 0
+
+    try:
+        sets = grid(args.param)
+    except ValueError as e:
+        parser.error(str(e))
+    # Prottek parameter set e same seed gulo, jate set gulo tulona kora jay
+    jobs = [(p, args.seed + i) for p in sets for i in range(args.games)]
+    print(f"{len(sets)} parameter sets x {args.games} games on {args.workers} workers")
+
+    rows = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers) as pool, open(args.out, "w") as out:
+        futures = [pool.submit(run_game, p, seed, args.ticks, args.fp, args.stride)
+                   for p, seed in jobs]
+        # Shesh howa matro game er result file e likhe, crash holeo age porjonto thake
+        for done, fut in enumerate(as_completed(futures), 1):
+            row = fut.result()
+            rows.append(row)
+            out.write(json.dumps(row) + "\n")
+            out.flush()
+            if done % 100 == 0 or done == len(jobs):
+                print(f"  {done}/{len(jobs)} games  {time.perf_counter() - start:.1f}s",
+                      file=sys.stderr)
+
+    print(f"results written to {args.out}")
+    report(aggregate(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
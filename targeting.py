@@ -0,0 +1,95 @@
+import math
+
+import numpy as np
+
+
+def lead_points(gx, gy, xs, ys, vxs, vys, speed):
+    # Bullet jokhon pouchabe tokhon enemy kothay thakbe (velocity proti tick)
+    dx, dy = xs - gx, ys - gy
+    a = vxs * vxs + vys * vys - speed * speed
+    b = 2 * (dx * vxs + dy * vys)
+    c = dx * dx + dy * dy
+    # a*t^2 + b*t + c = 0 er shobcheye choto positive t
+    disc = b * b - 4 * a * c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(np.maximum(disc, 0))
+        t1 = (-b - root) / (2 * a)
+        t2 = (-b + root) / (2 * a)
+        lin = -c / b  # a == 0 hole equation linear
+    t = np.where(t1 > 0, t1, t2)
+    t = np.where(np.abs(a) < 1e-12, lin, t)
+    # Bullet dhorte na parle (disc < 0) shoja enemy er dike aim kore
+    t = np.where((disc >= 0) & np.isfinite(t) & (t > 0), t, 0.0)
+    return xs + vxs * t, ys + vys * t
+
+
+def lead_point(gx, gy, x, y, vx, vy, speed):
+    # lead_points er ekta enemy er version, numpy chara (proti tick er turning er jonno)
+    dx, dy = x - gx, y - gy
+    a = vx * vx + vy * vy - speed * speed
+    b = 2 * (dx * vx + dy * vy)
+    c = dx * dx + dy * dy
+    t = 0.0
+    if abs(a) < 1e-12:
+        if b < 0:
+            t = -c / b
+    else:
+        disc = b * b - 4 * a * c
+        if disc >= 0:
+            root = math.sqrt(disc)
+            t1, t2 = (-b - root) / (2 * a), (-b + root) / (2 * a)
+            t = t1 if t1 > 0 else t2
+            t = t if t > 0 else 0.0
+    return x + vx * t, y + vy * t
+
+
+def claimed(bx, by, bvx, bvy, xs, ys, vxs, vys, radius):
+    # Kon enemy ke already uri jawa kono bullet dhore felbe (bool mask)
+    # Bullet er shapekkhe enemy er position and velocity (bullet x enemy)
+    rx, ry = xs - bx[:, None], ys - by[:, None]
+    vx, vy = vxs - bvx[:, None], vys - bvy[:, None]
+    # Shobcheye kache ashar shomoy (future e), tokhon er distance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.nan_to_num(np.maximum(-(rx * vx + ry * vy) / (vx * vx + vy * vy), 0))
+    dx, dy = rx + vx * t, ry + vy * t
+    return (dx * dx + dy * dy <= radius * radius).any(axis=0)
+
+
+class Targeter:
+    # Enemy gulor bearing sort kore rakhe, jate nearest target O(log n) e pawa jay
+    def __init__(self):
+        self.order = np.zeros(0, dtype=np.int64)  # Bearing onujayi enemy index
+        self.sorted = np.zeros(0)                  # Sorted bearing (degree)
+
+    def update(self, gx, gy, xs, ys, vxs, vys, speed):
+        # Shob enemy er lead point er bearing ek pass e calculate kore
+        lx, ly = lead_points(gx, gy, xs, ys, vxs, vys, speed)
+        bearing = np.degrees(np.arctan2(ly - gy, lx - gx)) % 360
+        if len(self.order) == len(bearing):
+            # Enemy ektu ektu nore, tai ager order prae sorted thake
+            # and stable sort (timsort) ta prae linear time e shesh hoy
+            order = self.order[np.argsort(bearing[self.order], kind="stable")]
+        else:
+            order = np.argsort(bearing, kind="stable")
+        self.order = order
+        self.sorted = bearing[order]
+
+    def ahead(self, heading, skip=None, limit=8):
+        # heading theke ghurar dike (bearing barar dike) prothom enemy:
+        # (index, bearing, koto degree ghurte hobe)
+        # skip(indices) samner limit ta candidate er mask dey, true gulo bad jay;
+        # shob bad gele None (ek enemy ke bar bar guli na kore)
+        n = len(self.sorted)
+        if not n:
+            return None
+        # Ager frame e aim kora enemy ektu pichone thakte pare, tai ektu slack
+        i = int(np.searchsorted(self.sorted, (heading - 0.5) % 360))
+        ks = np.arange(i, i + min(n, limit)) % n
+        if skip is not None:
+            free = np.flatnonzero(~skip(self.order[ks]))
+            if not free.size:
+                return None
+            ks = ks[free]
+        k = ks[0]
+        b = float(self.sorted[k])
+        return int(self.order[k]), b, (b - heading + 0.5) % 360 - 0.5
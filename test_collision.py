@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from collision import first_hits, sweep_contact
+from headless import HeadlessEngine
+
+
+def still_arena(monkeypatch, xs, ys, bullet_spd=1):
+    # Enemy na nore, mara gele notun spawn hoy na, jate shudhu collision dekha jay
+    engine = HeadlessEngine(seed=1, enemies=0)
+    cfg = engine.cfg
+    cfg.e_spd = 0
+    cfg.sep_weight = 0
+    cfg.bullet_spd = bullet_spd
+    cfg.max_miss = 10 ** 6
+    monkeypatch.setattr(engine.logic, "spawn_enemies", lambda count=1: None)
+    cfg.enemies.add_many(np.asarray(xs, float), np.asarray(ys, float), 0)
+    return engine
+
+
+@pytest.mark.parametrize("stride", [1, 400])
+def test_near_enemy_dies_first(monkeypatch, stride):
+    engine = still_arena(monkeypatch, [0, 0], [-400, -200])
+    engine.cfg.p_rot = 0  # Bullet -y dike jay
+    engine.logic.fire_weapon()
+    engine.step(400, stride)
+    assert engine.cfg.score == 1
+    assert engine.cfg.enemies.view("y").tolist() == [-400]
+
+
+def radial_score(monkeypatch, stride):
+    rng = np.random.default_rng(0)
+    engine = still_arena(monkeypatch, rng.uniform(-500, 500, 40),
+                         rng.uniform(-500, 500, 40), bullet_spd=5)
+    for k in range(120):
+        engine.cfg.p_rot = k * 3
+        engine.logic.fire_weapon()
+    engine.step(1000, stride)
+    return engine.cfg.score
+
+
+def test_stride_keeps_hits(monkeypatch):
+    expected = radial_score(monkeypatch, 1)
+    assert expected > 20
+    for stride in (7, 100, 1000):
+        assert radial_score(monkeypatch, stride) == expected
+
+
+def test_bullet_moves_on_to_next_contact():
+    # Bullet 0 er prothom enemy (0) bullet 1 age dhore, tai bullet 0 enemy 1 ke mare
+    qi, ei = first_hits(np.array([0, 0, 1]), np.array([0, 1, 0]),
+                        np.array([0.5, 0.8, 0.1]))
+    assert sorted(zip(qi.tolist(), ei.tolist())) == [(0, 1), (1, 0)]
+
+
+def test_sweep_contact_entry_time():
+    t = sweep_contact(np.array([-10.0, 0.0, -10.0]), np.array([0.0, 0.0, 5.0]),
+                      np.array([10.0, 1.0, 10.0]), np.array([0.0, 0.0, 5.0]), 2.0)
+    assert t[0] == pytest.approx(0.4)
+    assert t[1] == 0.0
+    assert np.isinf(t[2])
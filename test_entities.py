@@ -0,0 +1,61 @@
+import numpy as np
+
+from entities import EntityStore, sample_outside
+from headless import HeadlessEngine
+
+
+def filled(n):
+    store = EntityStore(4)
+    store.add_many(np.arange(n, dtype=float), np.arange(n, dtype=float) * 10)
+    return store
+
+
+def test_remove_unsorted_duplicate_indices():
+    store = filled(8)
+    store.remove([5, 1, 5, 7, 1])
+    assert len(store) == 5
+    assert sorted(store.view("ids").tolist()) == [0, 2, 3, 4, 6]
+    # Prottek entity er field gulo eksathe shore
+    assert (store.view("x") == store.view("ids")).all()
+    assert (store.view("y") == store.view("ids") * 10).all()
+
+
+def test_remove_last_element():
+    store = filled(3)
+    store.remove([2])
+    assert store.view("ids").tolist() == [0, 1]
+    store.remove([0, 1])
+    assert len(store) == 0
+    store.remove([])
+    assert len(store) == 0
+
+
+def test_remove_then_add_reuses_slots():
+    store = filled(6)
+    capacity = store.capacity
+    store.remove(np.array([4, 0, 2]))
+    store.add_many(np.array([100.0, 101.0, 102.0]), np.zeros(3))
+    assert store.capacity == capacity
+    assert len(set(store.view("ids").tolist())) == 6
+
+
+def test_sample_outside_never_hits_gap():
+    u = np.random.default_rng(0).random(10000)
+    for gap_lo, gap_hi in [(-200, 200), (-700, -300), (300, 700), (-600, 600)]:
+        xs = sample_outside(u, -500, 500, gap_lo, gap_hi)
+        assert ((xs >= -500) & (xs <= 500)).all()
+        if gap_hi - gap_lo < 1000:
+            assert not ((xs > gap_lo) & (xs < gap_hi)).any()
+
+
+def test_sample_outside_covers_both_sides():
+    xs = sample_outside(np.linspace(0, 1, 1000, endpoint=False), -500, 500, -200, 200)
+    assert (xs < -200).any() and (xs > 200).any()
+
+
+def test_spawn_keeps_out_of_player_band():
+    engine = HeadlessEngine(seed=5, enemies=2000)
+    cfg = engine.cfg
+    px, py = cfg.p_pos[0], cfg.p_pos[1]
+    assert (np.abs(cfg.enemies.view("x") - px) >= 200).all()
+    assert (np.abs(cfg.enemies.view("y") - py) >= 200).all()
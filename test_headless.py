@@ -0,0 +1,19 @@
+import pytest
+
+from headless import HeadlessEngine
+
+
+def play(stride, fp):
+    engine = HeadlessEngine(seed=1, enemies=20, auto_shoot=True, auto_aim=fp, fp=fp)
+    ran = engine.step(8000, stride)
+    cfg = engine.cfg
+    return ran, cfg.score, cfg.hp, cfg.misses, cfg.over
+
+
+@pytest.mark.parametrize("fp", [False, True])
+def test_auto_shoot_same_at_any_stride(fp):
+    # Same seed e stride 1 and stride N e score and kon tick e game over ek
+    expected = play(1, fp)
+    assert expected[-1]  # Game over er tick o mile kina dekha jay
+    for stride in (5, 17):
+        assert play(stride, fp) == expected
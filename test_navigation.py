@@ -0,0 +1,34 @@
+import numpy as np
+
+from navigation import FlowField
+
+
+def crowded_field(weight):
+    # Player (0, 0) er dike ekta ghono bhir, bhir er pichone faka
+    field = FlowField(50, -500, 500)
+    field.update(0, 0)
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(100, 300, 2000)
+    ys = rng.uniform(-100, 100, 2000)
+    keys = field.crowd(xs, ys, weight)
+    return field, xs, ys, keys
+
+
+def test_crowd_never_turns_enemies_away():
+    field, xs, ys, keys = crowded_field(0.75)
+    dx, dy = field.steer(keys)
+    seek_x, seek_y = field.sample(xs, ys)
+    assert (dx * seek_x + dy * seek_y > 0).all()
+    # Dhakka kichu enemy ke shoja rasta theke shoray
+    assert not np.allclose(dx, seek_x)
+
+
+def test_crowd_clamps_length():
+    field, xs, ys, keys = crowded_field(0.75)
+    dx, dy = field.steer(keys)
+    assert (np.hypot(dx, dy) <= 1 + 1e-9).all()
+
+
+def test_crowd_off_is_pure_field():
+    field, xs, ys, keys = crowded_field(0)
+    assert np.array_equal(np.stack(field.steer(keys)), np.stack(field.sample(xs, ys)))
@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+
+import net
+from replay import KEY
+from server import MAX_INPUTS, Session, World
+
+
+def shared(seed=1, players=2):
+    world = World(seed)
+    sessions = [Session(None, world) for _ in range(players)]
+    for session in sessions:
+        session.inputs.append((KEY, ord("c")))
+        session.apply_inputs()
+    return world, sessions
+
+
+def send(world, session, ticks=200):
+    # World chalay and session er porer snapshot (frames shoho) dey
+    world.advance(ticks, 1)
+    payload = session.snapshot(world.capture())[net.FRAME.size:]
+    return payload, session.history[session.seq]
+
+
+def same(frames, expected):
+    assert len(frames) == len(expected) == net.FRAMES
+    for (ids, q), (e_ids, e_q) in zip(frames, expected):
+        assert np.array_equal(ids, e_ids) and np.array_equal(q, e_q)
+
+
+def test_full_snapshot_round_trip():
+    world, (session, _) = shared()
+    payload, frames = send(world, session)
+    seq, view, decoded = net.decode(payload, {})
+    assert seq == session.seq and net.SNAP_HEAD.unpack_from(payload)[1] == 0
+    assert view[5] == session.player.cfg.score
+    same(decoded, frames)
+
+
+def test_delta_on_stale_base():
+    world, (session, _) = shared()
+    history = {}
+    for _ in range(3):
+        payload, _ = send(world, session)
+        seq, _, frames = net.decode(payload, history)
+        history[seq] = frames
+    # Client shudhu prothom ta ack koreche, tai porer snapshot er base purono
+    session.acked = 1
+    payload, frames = send(world, session)
+    assert net.SNAP_HEAD.unpack_from(payload)[1] == 1
+    _, _, decoded = net.decode(payload, {1: history[1]})
+    same(decoded, frames)
+
+
+def test_missing_base_sends_full():
+    world, (session, _) = shared()
+    for _ in range(net.HISTORY + 2):
+        send(world, session, 5)
+    # Ack kora snapshot server er history theke bad gese
+    session.acked = 1
+    payload, frames = send(world, session)
+    assert net.SNAP_HEAD.unpack_from(payload)[1] == 0
+    same(net.decode(payload, {})[2], frames)
+
+
+def test_players_share_one_world():
+    world, (a, b) = shared()
+    assert a.player.cfg.enemies is b.player.cfg.enemies is world.game.cfg.enemies
+    _, frames = send(world, a)
+    # Client onno player ke dekhe, nijeke na
+    assert frames[-1][0].tolist() == [b.slot]
+
+
+def test_world_rng_is_seeded_and_private():
+    def play(seed):
+        world, sessions = shared(seed)
+        random.random()
+        world.advance(3000, 7)
+        return world.capture(), [(s.player.cfg.score, s.player.cfg.misses) for s in sessions]
+
+    (frames, scores), (again, again_scores) = play(4), play(4)
+    same(again, frames)
+    assert again_scores == scores
+
+
+def test_inputs_are_bounded():
+    world, (session, _) = shared()
+    for _ in range(MAX_INPUTS * 2):
+        session.inputs.append((KEY, ord("a")))
+    assert len(session.inputs) == MAX_INPUTS
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+import replay
+from intense import GameController
+from replay import InputLog
+
+
+def record(path, seed, ticks):
+    # Window er moto input dey and prottek tick e logic chalay
+    random.seed(seed)
+    game = GameController()
+    game.log = InputLog(seed)
+    game.start_game()
+    game.keyboard_handler(b"c")
+    for t in range(ticks):
+        if t % 400 == 0:
+            game.keyboard_handler(b"a")
+        if t % 700 == 0:
+            game.mouse_handler(0, 0, 0, 0)
+        if t == 1500:
+            game.special_key_handler(100)
+        if not game.cfg.over:
+            game.logic.tick()
+            game.tick_count += 1
+    game.log.save(path, game)
+    return game
+
+
+def test_replay_matches_recording(tmp_path):
+    path = tmp_path / "session.rec"
+    game = record(path, 7, 3000)
+    seed, events, expected = replay.load(path)
+    assert seed == 7
+    assert len(events) - 1 == len(game.log)
+    assert tuple(expected) == (game.cfg.score, game.cfg.hp, game.cfg.misses)
+
+    # Onno RNG state theke shuru korleo same result
+    random.seed(12345)
+    again = replay.replay(seed, events)
+    assert again.tick_count == game.tick_count
+    assert (again.cfg.score, again.cfg.hp, again.cfg.misses) == tuple(expected)
+    assert replay.main([str(path)]) == 0
+
+
+def test_rejects_other_version(tmp_path):
+    path = tmp_path / "session.rec"
+    record(path, 3, 10)
+    data = bytearray(path.read_bytes())
+    data[4] = replay.VERSION + 1
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        replay.load(path)
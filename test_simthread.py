@@ -0,0 +1,36 @@
+import numpy as np
+
+from headless import HeadlessEngine
+from simthread import SimThread
+
+
+def test_publish_waits_for_reader_and_reuses_buffers():
+    engine = HeadlessEngine(seed=1, enemies=20)
+    sim = SimThread(engine.game)
+    first = sim.front
+    assert sim.publish(1)
+    second = sim.front
+    assert second is not first
+    # Render ekhono first porche, tai second er por ar likhe na
+    engine.step(5)
+    assert not sim.publish(2)
+    assert sim.front is second
+
+    sim.reading = second
+    xs = first.stores["enemies"][1]["x"]
+    assert sim.publish(3)
+    # Purono buffer e abar likhe, notun array banay na
+    assert sim.front is first and first.ticks == 3
+    assert np.shares_memory(first.stores["enemies"][1]["x"], xs)
+    assert np.array_equal(first.stores["enemies"][1]["x"], engine.cfg.enemies.view("x"))
+    assert not first.stores["enemies"][1]["x"].flags.writeable
+
+
+def test_capture_grows_with_store():
+    engine = HeadlessEngine(seed=1, enemies=5)
+    sim = SimThread(engine.game)
+    engine.logic.spawn_enemies(500)
+    sim.publish(1)
+    count, arrays = sim.front.stores["enemies"]
+    assert count == len(engine.cfg.enemies)
+    assert np.array_equal(arrays["ids"], engine.cfg.enemies.view("ids"))
@@ -0,0 +1,34 @@
+import pytest
+
+from headless import HeadlessEngine
+from state import GameState
+
+
+def engine():
+    return HeadlessEngine(seed=4, enemies=20, auto_shoot=True)
+
+
+@pytest.mark.parametrize("via_file", [False, True])
+def test_restore_then_simulate_matches(tmp_path, via_file):
+    first = engine()
+    first.step(1237)
+    snap = first.cfg.state.snapshot()
+    if via_file:
+        first.cfg.state.save(tmp_path / "state.bin")
+    first.step(3000)
+
+    # Onno seed and alada tick er game e restore korleo same jaygay pouchay
+    second = HeadlessEngine(seed=99, enemies=3)
+    second.step(50)
+    if via_file:
+        second.cfg.state.load(tmp_path / "state.bin")
+    else:
+        second.cfg.state.restore(snap)
+    assert second.cfg.state.snapshot() == snap
+    second.step(3000)
+    assert second.cfg.state.snapshot() == first.cfg.state.snapshot()
+
+
+def test_rejects_foreign_buffer():
+    with pytest.raises(ValueError):
+        GameState().restore(b"\0" * 4096)
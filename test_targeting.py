@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from targeting import Targeter, claimed, lead_point, lead_points
+
+
+def targeter(bearings):
+    # Origin theke 100 dure, deya bearing (degree) e stationary enemy
+    rad = np.radians(bearings)
+    xs, ys = 100 * np.cos(rad), 100 * np.sin(rad)
+    zero = np.zeros(len(xs))
+    t = Targeter()
+    t.update(0.0, 0.0, xs, ys, zero, zero, 1.0)
+    return t
+
+
+def test_ahead_picks_next_bearing_and_wraps():
+    t = targeter([10, 200, 90])
+    index, bearing, delta = t.ahead(80)
+    assert index == 2 and bearing == pytest.approx(90) and delta == pytest.approx(10)
+    # 200 er pore 10 degree e ghure ashe
+    index, _, delta = t.ahead(250)
+    assert index == 0 and delta == pytest.approx(120)
+
+
+def test_ahead_skips_claimed_and_holds_when_all_claimed():
+    t = targeter([10, 20, 30])
+    assert t.ahead(0, lambda idx: idx == 0)[0] == 1
+    assert t.ahead(0, lambda idx: np.ones(len(idx), dtype=bool)) is None
+    assert Targeter().ahead(0) is None
+
+
+def test_claimed_by_bullet_on_course():
+    # Bullet +x dike jay: prothom enemy samne, ditiyo pichone, tritiyo pashe dure
+    bx, by = np.array([0.0]), np.array([0.0])
+    bvx, bvy = np.array([1.0]), np.array([0.0])
+    xs, ys = np.array([100.0, -100.0, 100.0]), np.array([5.0, 0.0, 80.0])
+    zero = np.zeros(3)
+    assert claimed(bx, by, bvx, bvy, xs, ys, zero, zero, 10).tolist() == [True, False, False]
+
+
+def test_claimed_handles_same_velocity_and_no_bullets():
+    # Bullet and enemy er velocity ek hole relative speed 0, distance bodlay na
+    mask = claimed(np.array([0.0]), np.array([0.0]), np.array([1.0]), np.array([0.0]),
+                   np.array([5.0, 50.0]), np.array([0.0, 0.0]),
+                   np.array([1.0, 1.0]), np.array([0.0, 0.0]), 10)
+    assert mask.tolist() == [True, False]
+    empty = np.zeros(0)
+    assert not claimed(empty, empty, empty, empty, np.array([1.0]), np.array([1.0]),
+                       np.array([0.0]), np.array([0.0]), 10).any()
+
+
+def test_lead_point_matches_vectorised():
+    gx, gy, speed = 3.0, -2.0, 5.0
+    xs, ys = np.array([100.0, -40.0]), np.array([20.0, 70.0])
+    vxs, vys = np.array([0.5, -1.0]), np.array([-1.0, 0.2])
+    lx, ly = lead_points(gx, gy, xs, ys, vxs, vys, speed)
+    for i in range(2):
+        px, py = lead_point(gx, gy, xs[i], ys[i], vxs[i], vys[i], speed)
+        assert (px, py) == pytest.approx((lx[i], ly[i]))
+        # Bullet jotokkhone pouchay enemy o oi point e thake
+        t = (px - xs[i]) / vxs[i]
+        assert np.hypot(px - gx, py - gy) == pytest.approx(speed * t)